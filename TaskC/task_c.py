@@ -20,7 +20,29 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 """
 
-from datetime import datetime
+import asyncio
+import io
+import json
+import operator
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows, writes are then unlocked
+    fcntl = None
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import iterate, phase  # noqa: E402  (shared module in the repository root)
+from reservation_lookup import ReservationLookup  # noqa: E402
+from reservation_parsing import parse_created, parse_date, parse_time  # noqa: E402
+from reservation_tail import ReservationTail  # noqa: E402
 
 HEADERS = [
     "reservationId",
@@ -37,6 +59,7 @@ HEADERS = [
 ]
 
 
+@phase("convert")
 def convert_reservation_data(reservation: list) -> list:
     """
     Convert data types to meet program requirements
@@ -56,16 +79,86 @@ def convert_reservation_data(reservation: list) -> list:
     converted.append(reservation[1])  # name (str)
     converted.append(reservation[2])  # email (str)
     converted.append(reservation[3])  # phone (str)
-    converted.append(datetime.strptime(reservation[4],  "%Y-%m-%d").date())  # reservationDate (date)
-    converted.append(datetime.strptime(reservation[5], "%H:%M").time())  # reservationTime (time)
+    converted.append(parse_date(reservation[4]))  # reservationDate (date)
+    converted.append(parse_time(reservation[5]))  # reservationTime (time)
     converted.append(int(reservation[6]))  # durationHours (int)
     converted.append(float(reservation[7]))  # price (float)
     converted.append(reservation[8] == "True")  # confirmed (bool)
     converted.append(reservation[9])  # reservedResource (str)
-    converted.append(datetime.strptime(reservation[10].strip(), "%Y-%m-%d %H:%M:%S"))  # createdAt (datetime)
+    converted.append(parse_created(reservation[10].strip()))  # createdAt (datetime)
     return converted
 
 
+def convert_confirmed(text: str) -> bool:
+    """
+    Convert the confirmed column (True/False text) to bool
+    """
+    return text == "True"
+
+
+def convert_created(text: str) -> datetime:
+    """
+    Convert the createdAt column, which may end with the newline
+    """
+    return parse_created(text.strip())
+
+
+# Converter of each raw column, in HEADERS order
+COLUMN_CONVERTERS = [
+    int, str, str, str, parse_date, parse_time,
+    int, float, convert_confirmed, str, convert_created,
+]
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def query_reservations(reservation_file: str, filters: list[tuple]):
+    """
+    Reads only the reservations that match all filters
+
+    Each filter is evaluated on the raw split line by converting just
+    the one column it names, so rejected rows are never fully converted.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     filters (list): (column, operator, value) tuples, e.g.
+      ("durationHours", ">=", 3) or ("confirmed", "==", True)
+
+    Filters are checked at the call, so an unknown column or operator
+    raises ValueError before any reading starts.
+
+    Returns:
+     reservations (iterator): Converted matching reservations
+    """
+    checks = []
+    for column, op, value in filters:
+        if column not in HEADERS:
+            raise ValueError(f"Unknown column: {column}")
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {op}")
+        position = HEADERS.index(column)
+        checks.append((position, COLUMN_CONVERTERS[position], OPERATORS[op], value))
+
+    def matching():
+        with open(reservation_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                fields = line.split("|")
+                if all(compare(convert(fields[position]), value) for position, convert, compare, value in checks):
+                    yield convert_reservation_data(fields)
+
+    return matching()
+
+
+@phase("parse")
 def fetch_reservations(reservation_file: str) -> list:
     """
     Reads reservations from a file and returns the reservations converted
@@ -85,6 +178,767 @@ def fetch_reservations(reservation_file: str) -> list:
     return reservations
 
 
+def chunk_offsets(reservation_file: str, chunks: int) -> list[tuple[int, int]]:
+    """
+    Splits a file into byte ranges that start and end on line boundaries
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     chunks (int): Wanted number of ranges
+
+    Returns:
+     offsets (list): (start, end) byte offsets
+    """
+    size = os.path.getsize(reservation_file)
+    step = max(1, size // max(1, chunks))
+    offsets = []
+    start = 0
+    with open(reservation_file, "rb") as f:
+        while start < size:
+            f.seek(min(start + step, size))
+            f.readline()  # move to the start of the next line
+            end = min(f.tell(), size)
+            offsets.append((start, end))
+            start = end
+    return offsets
+
+
+class ReservationColumns:
+    """
+    Compact column store for converted reservations
+
+    Numbers, dates and times are kept in typed arrays and resource names
+    are interned. Indexing and iteration rebuild the same 11-column list
+    that convert_reservation_data returns, so the report functions work
+    unchanged.
+    """
+
+    __slots__ = (
+        "ids", "names", "emails", "phones", "dates", "times",
+        "durations", "prices", "confirmed", "resources", "created",
+    )
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names = []
+        self.emails = []
+        self.phones = []
+        self.dates = array("l")  # date ordinals
+        self.times = array("l")  # seconds since midnight
+        self.durations = array("l")
+        self.prices = array("d")
+        self.confirmed = bytearray()
+        self.resources = []  # interned names
+        self.created = array("q")  # seconds since 0001-01-01
+
+    def append(self, reservation: list) -> None:
+        """
+        Add one converted reservation
+
+        Parameters:
+         reservation (list): Converted reservation -> 11 columns
+        """
+        start = reservation[5]
+        created = reservation[10]
+        self.ids.append(reservation[0])
+        self.names.append(reservation[1])
+        self.emails.append(reservation[2])
+        self.phones.append(reservation[3])
+        self.dates.append(reservation[4].toordinal())
+        self.times.append(start.hour * 3600 + start.minute * 60 + start.second)
+        self.durations.append(reservation[6])
+        self.prices.append(reservation[7])
+        self.confirmed.append(reservation[8])
+        self.resources.append(sys.intern(reservation[9]))
+        self.created.append(
+            created.toordinal() * 86400
+            + created.hour * 3600 + created.minute * 60 + created.second
+        )
+
+    def extend(self, other: "ReservationColumns") -> None:
+        """
+        Add all reservations of another column store
+        """
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> list:
+        seconds = self.times[i]
+        created, created_seconds = divmod(self.created[i], 86400)
+        return [
+            self.ids[i],
+            self.names[i],
+            self.emails[i],
+            self.phones[i],
+            date.fromordinal(self.dates[i]),
+            time(seconds // 3600, seconds // 60 % 60, seconds % 60),
+            self.durations[i],
+            self.prices[i],
+            bool(self.confirmed[i]),
+            self.resources[i],
+            datetime.combine(
+                date.fromordinal(created),
+                time(created_seconds // 3600, created_seconds // 60 % 60, created_seconds % 60),
+            ),
+        ]
+
+    def __iter__(self):
+        for i in range(len(self.ids)):
+            yield self[i]
+
+
+@phase("parse")
+def fetch_reservation_columns(reservation_file: str) -> ReservationColumns:
+    """
+    Reads reservations from a file into a compact column store
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+
+    Returns:
+     reservations (ReservationColumns): Read and converted reservations
+    """
+    reservations = ReservationColumns()
+    with open(reservation_file, "r", encoding="utf-8") as f:
+        for line in f:
+            fields = line.split("|")
+            reservations.append(convert_reservation_data(fields))
+    return reservations
+
+
+def convert_chunk(reservation_file: str, start: int, end: int) -> ReservationColumns:
+    """
+    Reads and converts the reservations in one byte range of a file
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     start (int): First byte of the range
+     end (int): Byte after the range
+
+    Returns:
+     reservations (ReservationColumns): Converted reservations of the range
+    """
+    with open(reservation_file, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    reservations = ReservationColumns()
+    # like iterating the file in text mode: lines end only at \n, \r or \r\n
+    for line in io.StringIO(text, newline=None):
+        if line.strip():
+            reservations.append(convert_reservation_data(line.split("|")))
+    return reservations
+
+
+@phase("parse")
+def fetch_reservations_parallel(reservation_file: str, workers: int | None = None) -> ReservationColumns:
+    """
+    Reads reservations from a file using a process pool
+
+    The file is split into newline-aligned byte ranges that are
+    converted in parallel and joined back in file order. Workers send
+    back column stores, whose typed arrays pickle as raw bytes, so the
+    parent does not have to unpickle a date, time and datetime object
+    per row. With one worker the file is read in-process.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     workers (int): Number of processes, all cores by default
+
+    Returns:
+     reservations (ReservationColumns): Read and converted reservations
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return fetch_reservation_columns(reservation_file)
+    offsets = chunk_offsets(reservation_file, workers * 4)
+    reservations = ReservationColumns()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(
+            convert_chunk,
+            [reservation_file] * len(offsets),
+            [start for start, _ in offsets],
+            [end for _, end in offsets],
+        )
+        for part in parts:
+            reservations.extend(part)
+    return reservations
+
+
+def iter_reservations(reservation_file: str):
+    """
+    Reads reservations from a file one at a time
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+
+    Yields:
+     reservation (list): Converted reservation
+    """
+    def read():
+        with open(reservation_file, "r", encoding="utf-8") as f:
+            for line in f:
+                yield convert_reservation_data(line.split("|"))
+
+    return iterate("parse", "reservations", read())
+
+
+class Report:
+    """
+    Base of the report accumulators, subclasses define add() and render()
+    """
+
+    @phase("render")
+    def print(self) -> None:
+        for line in self.render():
+            print(line)
+
+
+class ConfirmedReport(Report):
+    """
+    Accumulator for the confirmed reservations report
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, reservation: list) -> None:
+        if reservation[8]:
+            self.lines.append(f"- {reservation[1]}, {reservation[9]}, {reservation[4].strftime('%d.%m.%Y')} at {reservation[5].strftime('%H.%M')}")
+
+    def render(self) -> list[str]:
+        return ["1) Confirmed Reservations"] + self.lines + [""]
+
+
+class LongReport(Report):
+    """
+    Accumulator for the long reservations report
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, reservation: list) -> None:
+        if reservation[6] >= 3:
+            self.lines.append(f"- {reservation[1]}, {reservation[4].strftime('%d.%m.%Y')} at {reservation[5].strftime('%H.%M')}, duration {reservation[6]}, {reservation[9]}")
+
+    def render(self) -> list[str]:
+        return ["2) Long Reservations (≥ 3 h)"] + self.lines + [""]
+
+
+class StatusReport(Report):
+    """
+    Accumulator for the confirmation status report
+    """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, reservation: list) -> None:
+        if(reservation[8]):
+            self.lines.append(f"{reservation[1]} → Confirmed")
+        else:
+            self.lines.append(f"{reservation[1]} → NOT Confirmed")
+
+    def render(self) -> list[str]:
+        return ["3) Reservation Confirmation Status"] + self.lines + [""]
+
+
+class SummaryReport(Report):
+    """
+    Accumulator for the confirmation summary report
+    """
+
+    def __init__(self):
+        self.confirmed = 0
+        self.not_confirmed = 0
+
+    def add(self, reservation: list) -> None:
+        if(reservation[8]):
+            self.confirmed += 1
+        else:
+            self.not_confirmed += 1
+
+    def render(self) -> list[str]:
+        return [
+            "4) Confirmation Summary",
+            f"- Confirmed reservations: {self.confirmed} pcs",
+            f"- Not confirmed reservations: {self.not_confirmed} pcs",
+            "",
+        ]
+
+
+class RevenueReport(Report):
+    """
+    Accumulator for the total revenue report
+    """
+
+    def __init__(self):
+        self.amount = 0.0
+
+    def add(self, reservation: list) -> None:
+        self.amount += reservation[6]*reservation[7]
+
+    def render(self) -> list[str]:
+        amount_str = f"{self.amount:.2f}".replace(".", ",")
+        return [
+            "5) Total Revenue from Confirmed Reservations",
+            f"Total revenue from confirmed reservations: {amount_str} €",
+            "",
+        ]
+
+
+class TableReport(Report):
+    """
+    Prints every reservation with its data types (part A) as it arrives
+    """
+
+    def __init__(self):
+        print(" | ".join(HEADERS))
+        print("------------------------------------------------------------------------")
+
+    def add(self, reservation: list) -> None:
+        print(" | ".join(str(x) for x in reservation))
+        data_types = [type(x).__name__ for x in reservation]
+        print(" | ".join(data_types))
+        print(
+            "------------------------------------------------------------------------"
+        )
+
+    def render(self) -> list[str]:
+        return []
+
+
+@phase("aggregate")
+def run_reports(reservations, reports: list) -> list:
+    """
+    Feeds every reservation to all reports in a single pass
+
+    Parameters:
+     reservations (iterable): Reservations, e.g. from iter_reservations
+     reports (list): Report accumulators
+
+    Returns:
+     reports (list): The same accumulators, filled
+    """
+    for reservation in reservations:
+        for report in reports:
+            report.add(reservation)
+    return reports
+
+
+def format_reservation(reservation: list) -> str:
+    """
+    Formats a converted reservation as one line of the reservation file
+
+    Parameters:
+     reservation (list): Converted reservation -> 11 columns
+
+    Raises ValueError (UnicodeEncodeError included) for a field that
+    cannot be written, so ReservationWriter reports it to the caller.
+
+    Returns:
+     line (str): Pipe-delimited line ending with a newline
+    """
+    fields = [
+        str(reservation[0]),
+        reservation[1],
+        reservation[2],
+        reservation[3],
+        reservation[4].isoformat(),
+        reservation[5].strftime("%H:%M"),
+        str(reservation[6]),
+        f"{reservation[7]:.2f}",
+        str(bool(reservation[8])),
+        reservation[9],
+        reservation[10].strftime("%Y-%m-%d %H:%M:%S"),
+    ]
+    for field in fields:
+        if "|" in field or "\n" in field:
+            raise ValueError(f"Field contains a separator: {field!r}")
+    line = "|".join(fields) + "\n"
+    line.encode("utf-8")  # e.g. lone surrogates in a name
+    return line
+
+
+@phase("write")
+def append_lines(reservation_file: str, lines: list[str]) -> None:
+    """
+    Appends whole lines to the file under an exclusive advisory lock
+
+    All lines go out in one write followed by one fsync. A missing
+    newline at the end of the file is added first so records never
+    run together.
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     lines (list): Formatted lines
+    """
+    with open(reservation_file, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            data = "".join(lines).encode("utf-8")
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class ReservationWriter:
+    """
+    Appends reservations to the file with group commit
+
+    append() can be called from many threads. A background thread
+    collects the waiting reservations and writes them with a single
+    locked write and fsync, then wakes every caller of that batch.
+    """
+
+    def __init__(self, reservation_file: str, max_batch: int = 1000, max_delay: float = 0.002):
+        self.reservation_file = reservation_file
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.pending = queue.Queue()
+        self.closed = False
+        self.lock = threading.Lock()  # orders append() against close()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def append(self, reservation: list) -> None:
+        """
+        Appends one reservation, returns once it is on disk
+
+        Parameters:
+         reservation (list): Converted reservation -> 11 columns
+        """
+        request = {"line": format_reservation(reservation), "done": threading.Event(), "error": None}
+        with self.lock:
+            if self.closed:
+                raise ValueError("Reservation writer is closed")
+            self.pending.put(request)
+        request["done"].wait()
+        if request["error"] is not None:
+            raise request["error"]
+
+    def close(self) -> None:
+        """
+        Writes what is still waiting and stops the background thread
+        """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.pending.put(None)
+        self.thread.join()
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            request = self.pending.get()
+            if request is None:
+                break
+            batch = [request]
+            while len(batch) < self.max_batch:
+                try:
+                    request = self.pending.get(timeout=self.max_delay)
+                except queue.Empty:
+                    break
+                if request is None:
+                    running = False
+                    break
+                batch.append(request)
+            error = None
+            try:
+                append_lines(self.reservation_file, [request["line"] for request in batch])
+            except Exception as e:  # handed to the callers, the thread keeps running
+                error = e
+            for request in batch:
+                request["error"] = error
+                request["done"].set()
+
+
+# SQLite column types, in HEADERS order. The id is not the primary key,
+# so the implicit rowid keeps counting in insertion (file) order.
+SQL_TYPES = [
+    "INTEGER NOT NULL UNIQUE",
+    "TEXT NOT NULL",
+    "TEXT NOT NULL",
+    "TEXT NOT NULL",
+    "TEXT NOT NULL",  # YYYY-MM-DD
+    "TEXT NOT NULL",  # HH:MM
+    "INTEGER NOT NULL",
+    "REAL NOT NULL",
+    "INTEGER NOT NULL",  # 0 / 1
+    "TEXT NOT NULL",
+    "TEXT NOT NULL",  # YYYY-MM-DD HH:MM:SS
+]
+
+
+class SqliteReservations:
+    """
+    Reservation storage in an SQLite database
+
+    The table has one column per HEADERS entry. The text file format
+    can be imported with batched transactions and exported back, and
+    the five reports are computed with SQL queries.
+    """
+
+    def __init__(self, db_file: str):
+        self.connection = sqlite3.connect(db_file)
+        columns = ", ".join(f"{name} {sql_type}" for name, sql_type in zip(HEADERS, SQL_TYPES))
+        with self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS reservations ({columns})")
+            for column in ("email", "phone", "reservationDate", "confirmed"):
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{column} ON reservations ({column})"
+                )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def insert(self, reservations) -> int:
+        """
+        Inserts converted reservations in one transaction
+
+        Parameters:
+         reservations (iterable): Converted reservations
+
+        Returns:
+         count (int): Number of inserted reservations
+        """
+        rows = [
+            (
+                r[0], r[1], r[2], r[3],
+                r[4].isoformat(), r[5].strftime("%H:%M"),
+                r[6], r[7], int(r[8]), r[9],
+                r[10].strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            for r in reservations
+        ]
+        placeholders = ", ".join("?" * len(HEADERS))
+        with self.connection:
+            self.connection.executemany(f"INSERT INTO reservations VALUES ({placeholders})", rows)
+        return len(rows)
+
+    def import_file(self, reservation_file: str, batch_size: int = 10000) -> int:
+        """
+        Imports a pipe-delimited reservation file in batches
+
+        Parameters:
+         reservation_file (str): Name of the file containing the reservations
+         batch_size (int): Reservations per transaction
+
+        Returns:
+         count (int): Number of imported reservations
+        """
+        count = 0
+        batch = []
+        with open(reservation_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    batch.append(convert_reservation_data(line.split("|")))
+                if len(batch) >= batch_size:
+                    count += self.insert(batch)
+                    batch = []
+        return count + self.insert(batch)
+
+    def rows(self, where: str = "", params: tuple = ()):
+        """
+        Yields converted reservations in insertion order
+
+        Parameters:
+         where (str): Optional SQL condition
+         params (tuple): Parameters of the condition
+        """
+        sql = "SELECT * FROM reservations"
+        if where:
+            sql += f" WHERE {where}"
+        for row in self.connection.execute(sql + " ORDER BY rowid", params):
+            yield [
+                row[0], row[1], row[2], row[3],
+                parse_date(row[4]), parse_time(row[5]),
+                row[6], row[7], bool(row[8]), row[9],
+                parse_created(row[10]),
+            ]
+
+    def export_file(self, reservation_file: str) -> int:
+        """
+        Writes all reservations in the pipe-delimited file format
+
+        Returns:
+         count (int): Number of exported reservations
+        """
+        count = 0
+        with open(reservation_file, "w", encoding="utf-8") as f:
+            for row in self.connection.execute("SELECT * FROM reservations ORDER BY rowid"):
+                f.write(
+                    f"{row[0]}|{row[1]}|{row[2]}|{row[3]}|{row[4]}|{row[5]}|{row[6]}|"
+                    f"{row[7]:.2f}|{bool(row[8])}|{row[9]}|{row[10]}\n"
+                )
+                count += 1
+        return count
+
+    def reports(self) -> list:
+        """
+        Computes the five reports with SQL
+
+        Returns:
+         reports (list): Filled report accumulators in report order
+        """
+        confirmed = ConfirmedReport()
+        for reservation in self.rows("confirmed = 1"):
+            confirmed.add(reservation)
+
+        long = LongReport()
+        for reservation in self.rows("durationHours >= 3"):
+            long.add(reservation)
+
+        statuses = StatusReport()
+        for name, is_confirmed in self.connection.execute(
+            "SELECT name, confirmed FROM reservations ORDER BY rowid"
+        ):
+            statuses.lines.append(f"{name} → {'Confirmed' if is_confirmed else 'NOT Confirmed'}")
+
+        summary = SummaryReport()
+        summary.confirmed, summary.not_confirmed = self.connection.execute(
+            "SELECT COALESCE(SUM(confirmed), 0), COUNT(*) - COALESCE(SUM(confirmed), 0) FROM reservations"
+        ).fetchone()
+
+        revenue = RevenueReport()
+        # same as RevenueReport.add, which sums every reservation
+        revenue.amount = self.connection.execute(
+            "SELECT COALESCE(SUM(durationHours * price), 0.0) FROM reservations"
+        ).fetchone()[0]
+
+        return [confirmed, long, statuses, summary, revenue]
+
+
+class ReservationServer:
+    """
+    Query server over the reservations of one file
+
+    The file is loaded once into a ReservationLookup and the report
+    accumulators, and each request first picks up appended lines via
+    ReservationTail in a worker thread, so file reads do not block the
+    event loop. Requests are answered one at a time. Clients send one JSON object per line and get one
+    JSON object per line back:
+
+     {"op": "report"}                       all five reports
+     {"op": "report", "number": 4}          one report
+     {"op": "lookup", "by": "email", "value": "my@tinyrage.net"}
+      ("by" is "id" with an integer value, "email" or "phone" with a string)
+
+    Malformed requests get {"ok": false, "error": ...} back.
+    """
+
+    def __init__(self, reservation_file: str):
+        self.lookup = ReservationLookup()
+        self.reports = [ConfirmedReport(), LongReport(), StatusReport(), SummaryReport(), RevenueReport()]
+        self.tail = ReservationTail(reservation_file, convert_reservation_data, self.lookup, self.reports)
+        self.tail.refresh()
+        self.lock = asyncio.Lock()  # one refresh and answer at a time
+
+    async def answer(self, request: dict) -> dict:
+        """
+        Picks up appended lines, then answers one request
+
+        Parameters:
+         request (dict): Decoded request
+
+        Returns:
+         response (dict): Response to encode
+        """
+        async with self.lock:
+            try:
+                await asyncio.to_thread(self.tail.refresh)
+            except OSError as e:
+                return {"ok": False, "error": f"Cannot read {self.tail.filename}: {e.strerror}"}
+            return self.handle(request)
+
+    def handle(self, request: dict) -> dict:
+        """
+        Answers one request from the loaded reservations
+
+        Parameters:
+         request (dict): Decoded request
+
+        Returns:
+         response (dict): Response to encode
+        """
+        op = request.get("op")
+
+        if op == "report":
+            number = request.get("number")
+            if number is None:
+                reports = self.reports
+            elif type(number) is int and 1 <= number <= len(self.reports):
+                reports = [self.reports[number - 1]]
+            else:
+                return {"ok": False, "error": f"Unknown report: {number}"}
+            return {"ok": True, "lines": [line for report in reports for line in report.render()]}
+
+        if op == "lookup":
+            by = request.get("by")
+            value = request.get("value")
+            if by not in ("id", "email", "phone"):
+                return {"ok": False, "error": f"Unknown lookup: {by}"}
+            if (by == "id" and type(value) is not int) or (by != "id" and not isinstance(value, str)):
+                return {"ok": False, "error": f"Invalid value for {by} lookup: {value!r}"}
+            if by == "id":
+                found = self.lookup.find_id(value)
+                found = [] if found is None else [found]
+            elif by == "email":
+                found = self.lookup.find_email(value)
+            else:
+                found = self.lookup.find_phone(value)
+            return {"ok": True, "reservations": [format_reservation(r).rstrip("\n") for r in found]}
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    async def client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one connected client until it disconnects
+        """
+        try:
+            async for line in reader:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    response = await self.answer(request) if isinstance(request, dict) else {"ok": False, "error": "Request must be an object"}
+                except (ValueError, TypeError) as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+
+async def serve(reservation_file: str, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """
+    Runs the query server until it is interrupted
+
+    Parameters:
+     reservation_file (str): Name of the file containing the reservations
+     host (str): Address to listen on, localhost by default
+     port (int): Port to listen on
+    """
+    state = ReservationServer(reservation_file)
+    server = await asyncio.start_server(state.client, host, port)
+    async with server:
+        await server.serve_forever()
+
+
 def confirmed_reservations(reservations: list[list]) -> None:
     """
     Print confirmed reservations
@@ -92,24 +946,15 @@ def confirmed_reservations(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    print("1) Confirmed Reservations")
+    run_reports(reservations, [ConfirmedReport()])[0].print()
 
-    for reservation in reservations:
-        if reservation[8]:
-            print(f"- {reservation[1]}, {reservation[9]}, {reservation[4].strftime('%d.%m.%Y')} at {reservation[5].strftime('%H.%M')}")
-    print("")   
 def long_reservations(reservations: list[list]) -> None:
     """
     Print long reservations
     Parameters:
      reservations (list): Reservations
     """
-    print("2) Long Reservations (≥ 3 h)")
-
-    for reservation in reservations:
-        if reservation[6] >= 3:
-            print(f"- {reservation[1]}, {reservation[4].strftime('%d.%m.%Y')} at {reservation[5].strftime('%H.%M')}, duration {reservation[6]}, {reservation[9]}")
-    print("")
+    run_reports(reservations, [LongReport()])[0].print()
 
 def confirmation_statuses(reservations: list[list]) -> None:
     """
@@ -118,13 +963,7 @@ def confirmation_statuses(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    print("3) Reservation Confirmation Status")
-    for reservation in reservations:
-        if(reservation[8]):
-            print (f"{reservation[1]} → Confirmed")
-        else:
-            print (f"{reservation[1]} → NOT Confirmed")
-    print("")
+    run_reports(reservations, [StatusReport()])[0].print()
 
 def confirmation_summary(reservations: list[list]) -> None:
     """
@@ -133,20 +972,7 @@ def confirmation_summary(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    confirmed = 0
-    not_confirmed = 0
-    
-    print("4) Confirmation Summary")
-    for reservation in reservations:    
-        if(reservation[8]):
-            confirmed += 1
-        else:
-            not_confirmed += 1
-
-    print(f"- Confirmed reservations: {confirmed} pcs")
-
-    print(f"- Not confirmed reservations: {not_confirmed} pcs")
-    print("")
+    run_reports(reservations, [SummaryReport()])[0].print()
 
 def total_revenue(reservations: list[list]) -> None:
     """
@@ -155,43 +981,34 @@ def total_revenue(reservations: list[list]) -> None:
     Parameters:
      reservations (list): Reservations
     """
-    amount = 0.0
-    print("5) Total Revenue from Confirmed Reservations")
-    for reservation in reservations:
-        amount += reservation[6]*reservation[7]
-
-        amount_str = f"{amount:.2f}".replace(".", ",")
-    print(f"Total revenue from confirmed reservations: {amount_str} €", end="\n\n")
+    run_reports(reservations, [RevenueReport()])[0].print()
 
 def main():
     """
     Prints reservation information according to requirements
-    Reservation-specific printing is done in functions
+    Reservation-specific printing is done in report accumulators,
+    all of them filled in one pass over the file
+
+    With --serve the reservations are kept loaded and served over
+    localhost instead (see ReservationServer).
     """
-    reservations = fetch_reservations("reservations.txt")
+    if "--serve" in sys.argv[1:]:
+        asyncio.run(serve("reservations.txt"))
+        return
+
     # PART A -> Before continuing to part B, make sure that the following lines
     # print all the reservation data and the correct data types to the console. 
     # After that, you can remove this section or comment it out up to part B.
-    print(" | ".join(HEADERS))
-    print("------------------------------------------------------------------------")
-    for reservation in reservations:
-        print(" | ".join(str(x) for x in reservation))
-        data_types = [type(x).__name__ for x in reservation]
-        print(" | ".join(data_types))
-        print(
-            "------------------------------------------------------------------------"
-        )
+    table = TableReport()
 
     # PART B -> Build the output required in part B from this using
     # the predefined functions and the necessary print statements.
+    reports = [ConfirmedReport(), LongReport(), StatusReport(), SummaryReport(), RevenueReport()]
+
+    run_reports(iter_reservations("reservations.txt"), [table] + reports)
 
-    # print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
-    long_reservations(reservations)
-    confirmation_statuses(reservations)
-    confirmation_summary(reservations)
-    total_revenue(reservations)
-    # Continue from here
+    for report in reports:
+        report.print()
 
 
 if __name__ == "__main__":
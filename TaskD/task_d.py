@@ -2,8 +2,24 @@
 # License: MIT
 
 
-from datetime import datetime, date
+import os
+import sys
+from datetime import datetime
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import count, phase  # noqa: E402  (shared module in the repository root)
+
+def parse_time(text: str) -> datetime:
+    """ Parses the fixed-width ISO timestamp, strptime for anything else """
+
+    if len(text) >= 19 and text[10] == "T":
+        try:
+            return datetime.fromisoformat(text[:19])
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%dT%H:%M:%S")
+
+@phase("parse")
 def read_data(filename: str) -> list:
 
     data = []
@@ -11,46 +27,53 @@ def read_data(filename: str) -> list:
         next(file)  
         for line in file:
             parts = line.strip().split(";")
-            time = datetime.strptime(parts[0], "%Y-%m-%dT%H:%M:%S")
+            time = parse_time(parts[0])
             values = [float(x) if x else 0.0 for x in parts[1:]]
             data.append([time] + values)
     return data
 
-def main() -> None:
+@phase("aggregate")
+def calculate_daily(data: list) -> dict:
+    """ Groups rows by day and sums all phases in one pass (kWh) """
 
-    data = read_data("week42.csv")
-    
-    print("Week 42 electricity consumption and production (kWh, by phase)\n")
+    daily = {}
+    for row in data:
+        day = row[0].date()
+        totals = daily.get(day)
+        if totals is None:
+            totals = daily[day] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        totals[0] += row[1] / 1000
+        totals[1] += row[2] / 1000
+        totals[2] += row[3] / 1000
+        totals[3] += row[4] / 1000
+        totals[4] += row[5] / 1000
+        totals[5] += row[6] / 1000
+    return daily
+
+def report_title(days: list) -> str:
+    """ Names the period that was read: the ISO week, or the date range """
+
+    first, last = days[0], days[-1]
+    if first.isocalendar()[:2] == last.isocalendar()[:2]:
+        return f"Week {first.isocalendar()[1]}"
+    return f"{first.strftime('%d.%m.%Y')}–{last.strftime('%d.%m.%Y')}"
+
+@phase("render")
+def print_report(daily: dict) -> None:
+    """ Prints daily totals as a table """
+
+    days = sorted(daily)
+    if days:
+        print(f"{report_title(days)} electricity consumption and production (kWh, by phase)\n")
     print("Day          Date        Consumption [kWh]               Production [kWh]")
     print("            (dd.mm.yyyy)  v1      v2      v3             v1     v2     v3")
     print("---------------------------------------------------------------------------")
-    
-    
-    days = [
-        date(2025, 10, 13),  # Monday
-        date(2025, 10, 14),  # Tuesday
-        date(2025, 10, 15),  # Wednesday
-        date(2025, 10, 16),  # Thursday
-        date(2025, 10, 17),  # Friday
-        date(2025, 10, 18),  # Saturday
-        date(2025, 10, 19),  # Sunday
-    ]
 
     weekdays_fi = ["Maanantai", "Tiistai", "Keskiviikko", "Torstai", "Perjantai", "Lauantai", "Sunnuntai"]
 
     
-    for i in range(len(days)):
-        current_day = days[i]
-        c1 = c2 = c3 = p1 = p2 = p3 = 0.0
-        
-        for row in data:
-            if row[0].date() == current_day:
-                c1 += row[1] / 1000  
-                c2 += row[2] / 1000  
-                c3 += row[3] / 1000  
-                p1 += row[4] / 1000  
-                p2 += row[5] / 1000  
-                p3 += row[6] / 1000 
+    for current_day in days:
+        c1, c2, c3, p1, p2, p3 = daily[current_day]
         
         c1_str = f"{c1:.2f}".replace(".", ",")
         c2_str = f"{c2:.2f}".replace(".", ",")
@@ -59,9 +82,16 @@ def main() -> None:
         p2_str = f"{p2:.2f}".replace(".", ",")
         p3_str = f"{p3:.2f}".replace(".", ",")
         
-        print(f"{weekdays_fi[i]:<11} {current_day.strftime('%d.%m.%Y')} "
+        print(f"{weekdays_fi[current_day.weekday()]:<11} {current_day.strftime('%d.%m.%Y')} "
               f"{c1_str:>6}  {c2_str:>5}  {c3_str:>7}     "
               f"{p1_str:>10}  {p2_str:>5}  {p3_str:>5}")
 
+def main() -> None:
+
+    data = read_data("week42.csv")
+    count("rows", len(data))
+    daily = calculate_daily(data)
+    print_report(daily)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,8 +1,14 @@
 # Copyright (c) 2026 Gökhan Arifoglu
 # License: MIT
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import ENABLED as PROFILING, phase  # noqa: E402  (shared module in the repository root)
+
 # Finnish weekday names (Mon ... Sun)
 DAYS_FI = [
     "maanantai", "tiistai", "keskiviikko",
@@ -10,6 +16,18 @@ DAYS_FI = [
 ]
 
 
+def parse_time(text: str) -> datetime:
+    """ Parses the fixed-width ISO timestamp, strptime for anything else """
+
+    if len(text) >= 19 and text[10] == "T":
+        try:
+            return datetime.fromisoformat(text[:19])
+        except ValueError:
+            pass
+    return datetime.strptime(text, "%Y-%m-%dT%H:%M:%S")
+
+
+@phase("parse")
 def read_data(filename: str) -> list:
     """ Reads CSV file and returns data """
 
@@ -20,7 +38,7 @@ def read_data(filename: str) -> list:
 
         for line in file:
             parts = line.strip().split(";")
-            time = datetime.strptime(parts[0], "%Y-%m-%dT%H:%M:%S")
+            time = parse_time(parts[0])
             values = [float(x) if x else 0.0 for x in parts[1:]]
             data.append([time] + values)
 
@@ -32,6 +50,7 @@ def format_number(value: float) -> str:
     return f"{value:.2f}".replace(".", ",")
 
 
+@phase("aggregate")
 def calculate_day(data: list, day: date) -> list:
     """ Calculates daily totals for one day """
 
@@ -49,6 +68,7 @@ def calculate_day(data: list, day: date) -> list:
     return [c1, c2, c3, p1, p2, p3]
 
 
+@phase("render")
 def build_week(week_no: int, filename: str, days: list) -> str:
     """ Builds report for one week """
 
@@ -84,10 +104,32 @@ def build_week(week_no: int, filename: str, days: list) -> str:
     return "\n".join(lines)
 
 
-def write_report(text: str) -> None:
-    """ Writes report to file """
+def build_weeks(weeks: list, workers: int | None = None):
+    """ Builds week reports in a process pool, yields them in week order
+
+    With profiling on the weeks are built in this process, otherwise
+    the timings of the workers would be lost.
+    """
+
+    week_nos = [week[0] for week in weeks]
+    filenames = [week[1] for week in weeks]
+    days = [week[2] for week in weeks]
+
+    if PROFILING:
+        yield from map(build_week, week_nos, filenames, days)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(build_week, week_nos, filenames, days)
+
+
+@phase("write")
+def write_report(reports) -> None:
+    """ Streams week reports to file """
     with open("summary.txt", "w", encoding="utf-8") as file:
-        file.write(text)
+        for report in reports:
+            file.write(report)
+            file.write("\n")
 
 
 def main() -> None:
@@ -99,12 +141,7 @@ def main() -> None:
         (43, "week43.csv", [date(2025, 10, d) for d in range(20, 27)]),
     ]
 
-    report = ""
-    for week_no, filename, days in weeks:
-        report += build_week(week_no, filename, days)
-        report += "\n"
-
-    write_report(report)
+    write_report(build_weeks(weeks))
 
 
 if __name__ == "__main__":
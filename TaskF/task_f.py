@@ -1,10 +1,24 @@
 # Copyright (c) 2026 Gökhan Arifoglu
 # License: MIT
 
+import argparse
 import csv
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from collections import OrderedDict
 from datetime import datetime, date
+from fractions import Fraction
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import count, phase  # noqa: E402  (shared module in the repository root)
 
+
+@phase("parse")
 def read_data(filename: str) -> list[list[str]]:
     """Read CSV file and returns all rows."""
 
@@ -20,8 +34,70 @@ def read_data(filename: str) -> list[list[str]]:
     return rows
 
 
-def format_number(value: float) -> str:
-    """Formats number with comma and two decimals."""
+@phase("parse")
+def read_columns(filename: str) -> dict:
+    """Reads CSV file straight into typed column arrays.
+
+    Decimal commas are converted once for the whole file instead of
+    per value. Timestamps are stored as date ordinals and hours.
+    """
+
+    with open(filename, "r", encoding="utf-8") as file:
+        next(file)  # skip header
+        text = file.read().replace(",", ".")
+
+    days = array("l")
+    hours = array("b")
+    consumption = array("d")
+    production = array("d")
+    temperature = array("d")
+
+    ordinals = {}
+    in_order = True
+    last = 0
+
+    for line in text.splitlines():
+
+        if not line:
+            continue
+
+        parts = line.split(";")
+        day_str = parts[0][:10]
+
+        ordinal = ordinals.get(day_str)
+        if ordinal is None:
+            ordinal = ordinals[day_str] = date.fromisoformat(day_str).toordinal()
+
+        if ordinal < last:
+            in_order = False
+        last = ordinal
+
+        days.append(ordinal)
+        hours.append(int(parts[0][11:13]))
+        consumption.append(float(parts[1]))
+        production.append(float(parts[2]))
+        temperature.append(float(parts[3]))
+
+    return {
+        "days": days,
+        "hours": hours,
+        "consumption": consumption,
+        "production": production,
+        "temperature": temperature,
+        "in_order": in_order,
+    }
+
+
+def format_number(value: float | Fraction) -> str:
+    """Formats number with comma and two decimals.
+
+    Exact values (Fraction) are rounded half away from zero.
+    """
+
+    if isinstance(value, Fraction):
+        cents = int(abs(value) * 100 + Fraction(1, 2))
+        sign = "-" if value < 0 and cents else ""
+        return f"{sign}{cents // 100},{cents % 100:02d}"
 
     return f"{value:.2f}".replace(".", ",")
 
@@ -32,6 +108,18 @@ def parse_date(text: str) -> date:
     return datetime.strptime(text, "%d.%m.%Y").date()
 
 
+def parse_time(text: str) -> datetime:
+    """Parses the fixed-width ISO timestamp prefix, ignoring the offset."""
+
+    if len(text) >= 19 and text[10] == "T":
+        try:
+            return datetime.fromisoformat(text[:19])
+        except ValueError:
+            pass
+
+    return datetime.strptime(text[:19], "%Y-%m-%dT%H:%M:%S")
+
+
 def show_main_menu() -> str:
     """Shows main menu."""
 
@@ -55,6 +143,7 @@ def show_after_menu() -> str:
     return input("Choice: ").strip()
 
 
+@phase("aggregate")
 def calculate_daily(rows: list[list[str]]) -> dict:
     """Calculates daily totals."""
 
@@ -62,8 +151,7 @@ def calculate_daily(rows: list[list[str]]) -> dict:
 
     for row in rows[1:]:
 
-        time_str = row[0][:19]
-        dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S")
+        dt = parse_time(row[0])
         d = dt.date()
 
         c = float(row[1].replace(",", "."))
@@ -81,38 +169,262 @@ def calculate_daily(rows: list[list[str]]) -> dict:
     return daily
 
 
-def create_daily_report(daily: dict) -> list[str]:
-    """Creates daily report."""
+@phase("aggregate")
+def calculate_daily_columns(columns: dict) -> dict:
+    """Calculates daily totals from column arrays.
+
+    Rows of one day are a contiguous slice when the file is in time
+    order, so each day is summed with one sum() over the slice.
+    """
+
+    days = columns["days"]
+    consumption = columns["consumption"]
+    production = columns["production"]
+    temperature = columns["temperature"]
+
+    daily = {}
+
+    if not columns["in_order"]:
+
+        for i, ordinal in enumerate(days):
+
+            d = date.fromordinal(ordinal)
+
+            if d not in daily:
+                daily[d] = [0.0, 0.0, 0.0, 0]
+
+            daily[d][0] += consumption[i]
+            daily[d][1] += production[i]
+            daily[d][2] += temperature[i]
+            daily[d][3] += 1
+
+        return daily
+
+    start = 0
+
+    while start < len(days):
+
+        end = bisect_right(days, days[start], start)
+
+        daily[date.fromordinal(days[start])] = [
+            sum(consumption[start:end]),
+            sum(production[start:end]),
+            sum(temperature[start:end]),
+            end - start,
+        ]
+
+        start = end
+
+    return daily
+
+
+CACHE_MAGIC = b"DAYC1"
+CACHE_HEADER = struct.Struct("<5sqqq")
+
+
+def cache_path(filename: str) -> str:
+    """Returns the cache file name stored next to the CSV file."""
+
+    return filename + ".cache"
+
+
+@phase("write")
+def write_cache(filename: str, daily: dict, stat: os.stat_result) -> None:
+    """Writes daily totals to a binary cache next to the CSV file.
+
+    The header stores the CSV size and modification time from stat,
+    taken before the CSV was read, so that a CSV changed during or
+    after the parse invalidates the cache. The cache is written to a
+    uniquely named temporary file and renamed into place, so processes
+    starting at the same time do not overwrite each other's writes.
+    """
+
+    days = sorted(daily)
+
+    ordinals = array("q", [d.toordinal() for d in days])
+    consumption = array("d", [daily[d][0] for d in days])
+    production = array("d", [daily[d][1] for d in days])
+    temperature = array("d", [daily[d][2] for d in days])
+    counts = array("q", [daily[d][3] for d in days])
+
+    target = cache_path(filename)
+
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=os.path.dirname(os.path.abspath(target)),
+        prefix=os.path.basename(target) + ".", suffix=".tmp", delete=False,
+    ) as file:
+
+        try:
+            file.write(CACHE_HEADER.pack(CACHE_MAGIC, stat.st_size, stat.st_mtime_ns, len(days)))
+
+            for column in (ordinals, consumption, production, temperature, counts):
+                column.tofile(file)
+
+        except BaseException:
+            file.close()
+            os.unlink(file.name)
+            raise
+
+    try:
+        os.replace(file.name, target)
+    except OSError:
+        os.unlink(file.name)
+        raise
+
+
+@phase("parse")
+def read_cache(filename: str) -> dict | None:
+    """Reads daily totals from the cache, None if missing or stale."""
+
+    try:
+        stat = os.stat(filename)
+
+        with open(cache_path(filename), "rb") as file:
+
+            magic, size, mtime, n = CACHE_HEADER.unpack(file.read(CACHE_HEADER.size))
+
+            if magic != CACHE_MAGIC or size != stat.st_size or mtime != stat.st_mtime_ns:
+                return None
+
+            columns = []
+            for typecode in "qdddq":
+                column = array(typecode)
+                column.fromfile(file, n)
+                columns.append(column)
+
+    except (OSError, EOFError, struct.error):
+        return None
+
+    ordinals, consumption, production, temperature, counts = columns
+
+    return {
+        date.fromordinal(ordinals[i]): [consumption[i], production[i], temperature[i], counts[i]]
+        for i in range(n)
+    }
+
+
+def load_daily(filename: str) -> dict:
+    """Returns daily totals from the cache or parses the CSV file."""
+
+    daily = read_cache(filename)
+
+    if daily is None:
+
+        stat = os.stat(filename)  # before reading, see write_cache()
+        daily = calculate_daily_columns(read_columns(filename))
+
+        try:
+            write_cache(filename, daily, stat)
+        except OSError:
+            pass  # read-only directory, run without cache
+
+    return daily
+
+
+def to_milli(value: float) -> int:
+    """Converts a sum of 3-decimal (or 1-decimal) values to exact thousandths."""
+
+    return round(value * 1000)
+
+
+@phase("aggregate")
+def build_index(daily: dict) -> dict:
+    """Builds date-ordered cumulative sums of the daily totals.
+
+    Entry i of each cumulative array holds the total of the first i
+    days, so any date range is the difference of two entries. The
+    meter values have three decimals and temperatures one, so the sums
+    are kept as integer thousandths and never drift. Sums of the daily
+    average temperatures are kept as exact fractions.
+    """
+
+    days = sorted(daily)
+
+    cum_c = array("q", [0])
+    cum_p = array("q", [0])
+    cum_t = array("q", [0])
+    cum_n = array("q", [0])
+    cum_avg = [Fraction(0)]
+
+    for d in days:
+
+        c, p, t, n = daily[d]
+
+        cum_c.append(cum_c[-1] + to_milli(c))
+        cum_p.append(cum_p[-1] + to_milli(p))
+        cum_t.append(cum_t[-1] + to_milli(t))
+        cum_n.append(cum_n[-1] + n)
+        cum_avg.append(cum_avg[-1] + Fraction(to_milli(t), 1000 * n))
+
+    return {
+        "days": days,
+        "consumption": cum_c,
+        "production": cum_p,
+        "temp_sum": cum_t,
+        "count": cum_n,
+        "day_avg_sum": cum_avg,
+    }
+
+
+def query_range(index: dict, start: date, end: date) -> dict:
+    """Returns exact totals for days start..end (inclusive) from the index.
+
+    Sums are Fractions, each the difference of two index entries.
+    """
+
+    lo = bisect_left(index["days"], start)
+    hi = bisect_right(index["days"], end)
+
+    return {
+        "consumption": Fraction(index["consumption"][hi] - index["consumption"][lo], 1000),
+        "production": Fraction(index["production"][hi] - index["production"][lo], 1000),
+        "temp_sum": Fraction(index["temp_sum"][hi] - index["temp_sum"][lo], 1000),
+        "count": index["count"][hi] - index["count"][lo],
+        "day_avg_sum": index["day_avg_sum"][hi] - index["day_avg_sum"][lo],
+        "days": hi - lo,
+    }
+
+
+def create_daily_report(index: dict, cache: "ReportCache | None" = None) -> list[str]:
+    """Asks for a date range and creates daily report."""
 
     start_s = input("Enter start date (dd.mm.yyyy): ")
     end_s = input("Enter end date (dd.mm.yyyy): ")
 
+    if cache is not None:
+        return cache.daily(index, start_s, end_s)
+
+    return daily_report(index, start_s, end_s)
+
+
+def period_title(start_s: str, end_s: str) -> str:
+    """Returns the first line of a daily report."""
+
+    return f"Report for the period {start_s}–{end_s}"
+
+
+@phase("render")
+def daily_report(index: dict, start_s: str, end_s: str) -> list[str]:
+    """Creates daily report for dd.mm.yyyy start and end dates."""
+
     start = parse_date(start_s)
     end = parse_date(end_s)
 
     if end < start:
         start, end = end, start
 
-    total_c = 0.0
-    total_p = 0.0
-    temp_sum = 0.0
-    count = 0
+    totals = query_range(index, start, end)
 
-    for d in daily:
+    total_c = totals["consumption"]
+    total_p = totals["production"]
+    count = totals["count"]
 
-        if start <= d <= end:
-
-            total_c += daily[d][0]
-            total_p += daily[d][1]
-            temp_sum += daily[d][2]
-            count += daily[d][3]
-
-    avg_temp = temp_sum / count if count > 0 else 0
+    avg_temp = totals["temp_sum"] / count if count > 0 else 0
 
     lines = []
 
     """lines.append("-" * 50)"""
-    lines.append(f"Report for the period {start_s}–{end_s}")
+    lines.append(period_title(start_s, end_s))
     lines.append(f"- Total consumption: {format_number(total_c)} kWh")
     lines.append(f"- Total production: {format_number(total_p)} kWh")
     lines.append(f"- Average temperature: {format_number(avg_temp)} °C")
@@ -120,29 +432,32 @@ def create_daily_report(daily: dict) -> list[str]:
     return lines
 
 
-def create_monthly_report(daily: dict) -> list[str]:
-    """Creates monthly report."""
+def create_monthly_report(index: dict, cache: "ReportCache | None" = None) -> list[str]:
+    """Asks for a month and creates monthly report."""
 
     month = int(input("Enter month number (1-12): "))
 
-    total_c = 0.0
-    total_p = 0.0
-    temp_sum = 0.0
-    days = 0
+    if cache is not None:
+        return cache.monthly(index, month)
+
+    return monthly_report(index, month)
 
-    for d in daily:
 
-        if d.year == 2025 and d.month == month:
+@phase("render")
+def monthly_report(index: dict, month: int) -> list[str]:
+    """Creates monthly report for month 1-12."""
 
-            total_c += daily[d][0]
-            total_p += daily[d][1]
+    if not 1 <= month <= 12:
+        raise ValueError(f"month must be 1-12, not {month}")
 
-            day_avg = daily[d][2] / daily[d][3]
-            temp_sum += day_avg
+    last_day = monthrange(2025, month)[1]
+    totals = query_range(index, date(2025, month, 1), date(2025, month, last_day))
 
-            days += 1
+    total_c = totals["consumption"]
+    total_p = totals["production"]
+    days = totals["days"]
 
-    avg_temp = temp_sum / days if days > 0 else 0
+    avg_temp = totals["day_avg_sum"] / days if days > 0 else 0
 
     months = [
         "January", "February", "March", "April",
@@ -161,24 +476,17 @@ def create_monthly_report(daily: dict) -> list[str]:
     return lines
 
 
-def create_yearly_report(daily: dict) -> list[str]:
+@phase("render")
+def create_yearly_report(index: dict) -> list[str]:
     """Creates yearly report."""
 
-    total_c = 0.0
-    total_p = 0.0
-    temp_sum = 0.0
-    count = 0
-
-    for d in daily:
-
-        if d.year == 2025:
+    totals = query_range(index, date(2025, 1, 1), date(2025, 12, 31))
 
-            total_c += daily[d][0]
-            total_p += daily[d][1]
-            temp_sum += daily[d][2]
-            count += daily[d][3]
+    total_c = totals["consumption"]
+    total_p = totals["production"]
+    count = totals["count"]
 
-    avg_temp = temp_sum / count if count > 0 else 0
+    avg_temp = totals["temp_sum"] / count if count > 0 else 0
 
     lines = []
 
@@ -191,6 +499,72 @@ def create_yearly_report(daily: dict) -> list[str]:
     return lines
 
 
+class ReportCache:
+    """LRU cache of rendered report lines.
+
+    Keys are the report type and normalized parameters: the ordered
+    (start, end) dates for daily reports and the month number for
+    monthly reports. The first line of a daily report repeats the dates
+    as typed, so it is rebuilt on every hit. Use one cache per index.
+    """
+
+    def __init__(self, maxsize: int = 128):
+
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, build) -> list[str]:
+        """Returns cached lines for key, calling build() on a miss."""
+
+        lines = self.entries.get(key)
+
+        if lines is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            count("report_cache.hits")
+            return lines
+
+        self.misses += 1
+        count("report_cache.misses")
+
+        lines = self.entries[key] = build()
+
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+        return lines
+
+    def daily(self, index: dict, start_s: str, end_s: str) -> list[str]:
+        """Cached daily_report()."""
+
+        start, end = sorted((parse_date(start_s), parse_date(end_s)))
+        lines = self.get(("daily", start, end), lambda: daily_report(index, start_s, end_s))
+
+        return [period_title(start_s, end_s)] + lines[1:]
+
+    def monthly(self, index: dict, month: int) -> list[str]:
+        """Cached monthly_report()."""
+
+        return list(self.get(("monthly", month), lambda: monthly_report(index, month)))
+
+    def yearly(self, index: dict) -> list[str]:
+        """Cached create_yearly_report()."""
+
+        return list(self.get(("yearly",), lambda: create_yearly_report(index)))
+
+    def stats(self) -> dict:
+        """Returns hit and miss counts and the current size."""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+        }
+
+
 def print_report(lines: list[str]) -> None:
     """Prints report."""
 
@@ -200,6 +574,7 @@ def print_report(lines: list[str]) -> None:
         print(line)
 
 
+@phase("write")
 def write_report(lines: list[str]) -> None:
     """Writes report to file."""
 
@@ -209,12 +584,105 @@ def write_report(lines: list[str]) -> None:
             file.write(line + "\n")
 
 
+def run_batch(index: dict, spec_file: str, default_output: str = "report.txt",
+              cache: ReportCache | None = None) -> int:
+    """Creates every report listed in a spec file.
+
+    One report per line, # starts a comment:
+
+        daily 01.06.2025 30.06.2025 [output file]
+        monthly 5 [output file]
+        yearly [output file]
+
+    Reports go to the named output file, or to default_output, each
+    followed by an empty line. Files are written as reports are made.
+    A bad line, or one whose output file cannot be opened, is reported
+    on stderr and skipped. Repeated requests are answered from cache.
+
+    Returns the number of reports created.
+    """
+
+    if cache is None:
+        cache = ReportCache()
+
+    outputs = {}
+    created = 0
+
+    try:
+        with open(spec_file, "r", encoding="utf-8") as spec:
+
+            for number, line in enumerate(spec, start=1):
+
+                parts = line.split("#", 1)[0].split()
+
+                if not parts:
+                    continue
+
+                kind, args = parts[0].lower(), parts[1:]
+                arity = {"daily": 2, "monthly": 1, "yearly": 0}.get(kind)
+
+                try:
+                    if arity is None or len(args) not in (arity, arity + 1):
+                        raise ValueError(f"cannot read '{line.strip()}'")
+
+                    if kind == "daily":
+                        lines = cache.daily(index, args[0], args[1])
+                    elif kind == "monthly":
+                        lines = cache.monthly(index, int(args[0]))
+                    else:
+                        lines = cache.yearly(index)
+
+                except ValueError as error:
+                    print(f"{spec_file}:{number}: {error}", file=sys.stderr)
+                    continue
+
+                output = args[arity] if len(args) > arity else default_output
+
+                if output not in outputs:
+                    try:
+                        outputs[output] = open(output, "w", encoding="utf-8")
+                    except OSError as error:
+                        print(f"{spec_file}:{number}: cannot open {output}: {error.strerror}", file=sys.stderr)
+                        continue
+
+                outputs[output].write("\n".join(lines) + "\n\n")
+                created += 1
+
+    finally:
+        for file in outputs.values():
+            file.close()
+
+    return created
+
+
 def main() -> None:
-    """Main program."""
+    """Main program.
+
+    With --batch SPEC [--out FILE] the reports listed in SPEC are
+    written without menus, see run_batch().
+    """
+
+    parser = argparse.ArgumentParser(description="Electricity reports for 2025.csv")
+    parser.add_argument("--batch", metavar="SPEC", help="write the reports listed in SPEC without menus")
+    parser.add_argument("--out", metavar="FILE", default="report.txt", help="default output of --batch")
+    parser.add_argument("--profile", action="store_true", help="print a timing breakdown to stderr")
+    args = parser.parse_args()
+
+    daily = load_daily("2025.csv")
+
+    index = build_index(daily)
 
-    rows = read_data("2025.csv")
+    if args.batch is not None:
+        cache = ReportCache(maxsize=1024)
+        try:
+            created = run_batch(index, args.batch, args.out, cache)
+        except OSError as error:
+            parser.exit(1, f"batch failed: {error}\n")
+        stats = cache.stats()
+        print(f"{created} reports created ({stats['hits']} from cache)")
+        return
 
-    daily = calculate_daily(rows)
+    cache = ReportCache()
 
     last_report = []
 
@@ -223,13 +691,13 @@ def main() -> None:
         choice = show_main_menu()
 
         if choice == "1":
-            last_report = create_daily_report(daily)
+            last_report = create_daily_report(index, cache)
 
         elif choice == "2":
-            last_report = create_monthly_report(daily)
+            last_report = create_monthly_report(index, cache)
 
         elif choice == "3":
-            last_report = create_yearly_report(daily)
+            last_report = cache.yearly(index)
 
         elif choice == "4":
             print("Goodbye!")
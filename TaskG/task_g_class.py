@@ -22,11 +22,39 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 
 
-from datetime import datetime
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
+from itertools import repeat
+from operator import attrgetter
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import iterate, phase  # noqa: E402  (shared module in the repository root)
+from reservation_lookup import ReservationLookup  # noqa: E402
+from reservation_parsing import parse_created, parse_date, parse_time  # noqa: E402
+
+
+def to_minutes(day: date, start: time) -> int:
+    """ convert date and time to minutes since 0001-01-01 """
+    return day.toordinal() * 1440 + start.hour * 60 + start.minute
+
+def from_minutes(minutes: int) -> datetime:
+    """ convert minutes since 0001-01-01 back to datetime """
+    day, minute = divmod(minutes, 1440)
+    return datetime.combine(date.fromordinal(day), time(minute // 60, minute % 60))
 
 class Reservation:
     """ store one reservation """
-    
+
+    __slots__ = (
+        "id", "name", "email", "phone", "date", "time",
+        "duration", "price", "confirmed", "resource", "created",
+    )
 
     def __init__(self, reservation_id, name, email, phone, date, time, duration, price, confirmed, resource, created):
         self.id = reservation_id        # reservation ID
@@ -53,6 +81,15 @@ class Reservation:
         """ Calculate total price """
         return self.duration * self.price
 
+    def start_minute(self):
+        """ return start as minutes since 0001-01-01 """
+        return to_minutes(self.date, self.time)
+
+    def end_minute(self):
+        """ return end (exclusive) as minutes since 0001-01-01 """
+        return self.start_minute() + self.duration * 60
+
+@phase("convert")
 def convert_reservation(data: list[str]) -> Reservation:
     """ Convert a line from file into a Reservation object """
 
@@ -63,15 +100,16 @@ def convert_reservation(data: list[str]) -> Reservation:
         name=data[1],
         email=data[2],
         phone=data[3],
-        date=datetime.strptime(data[4], "%Y-%m-%d").date(),
-        time=datetime.strptime(data[5], "%H:%M").time(),
+        date=parse_date(data[4]),
+        time=parse_time(data[5]),
         duration=int(data[6]),
         price=float(data[7]),
         confirmed=data[8].strip() == "True",
-        resource=data[9],
-        created=datetime.strptime(data[10].strip(), "%Y-%m-%d %H:%M:%S")
+        resource=sys.intern(data[9]),
+        created=parse_created(data[10].strip())
     )
 
+@phase("parse")
 def fetch_reservations(filename: str) -> list[Reservation]:
     """ read reservations from file and return a list of Reservation """
 
@@ -86,69 +124,456 @@ def fetch_reservations(filename: str) -> list[Reservation]:
 
 
 
-def confirmed_reservations(reservations: list[Reservation]):
-    """ Print all confirmed reservations """
+def convert_confirmed(text: str) -> bool:
+    """ convert True/False text to boolean """
+    return text.strip() == "True"
+
+def convert_created(text: str) -> datetime:
+    """ convert createdAt text, which may end with the newline """
+    return parse_created(text.strip())
+
+# converters of the raw fields in file order
+FIELD_CONVERTERS = (
+    int, str, str, str, parse_date, parse_time,
+    int, float, convert_confirmed, sys.intern, convert_created,
+)
+
+def lazy_field(position: int):
+    """ property that converts raw field position on first access """
+
+    def get(self):
+        if not self.converted >> position & 1:
+            self.fields[position] = FIELD_CONVERTERS[position](self.fields[position])
+            self.converted |= 1 << position
+        return self.fields[position]
+
+    return property(get)
+
+class LazyReservation:
+    """ reservation that keeps the raw split line and converts each field on first access """
+
+    __slots__ = ("fields", "converted")
+
+    def __init__(self, data: list[str]):
+        self.fields = data      # raw fields, replaced by converted values
+        self.converted = 0      # bit per converted field
+
+    id = lazy_field(0)
+    name = lazy_field(1)
+    email = lazy_field(2)
+    phone = lazy_field(3)
+    date = lazy_field(4)
+    time = lazy_field(5)
+    duration = lazy_field(6)
+    price = lazy_field(7)
+    confirmed = lazy_field(8)
+    resource = lazy_field(9)
+    created = lazy_field(10)
+
+    is_confirmed = Reservation.is_confirmed
+    is_long = Reservation.is_long
+    total_price = Reservation.total_price
+    start_minute = Reservation.start_minute
+    end_minute = Reservation.end_minute
+
+def fetch_lazy_reservations(filename: str) -> list[LazyReservation]:
+    """ read reservations from file without converting any field yet """
 
+    reservations = []
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                reservations.append(LazyReservation(line.split("|")))
+    return reservations
+
+
+
+SNAPSHOT_MAGIC = b"RSNP1"
+SNAPSHOT_HEADER = struct.Struct("<5sQQ")  # magic, records, strings
+# id, name, email, phone, date ordinal, start minute, duration, price cents, confirmed, resource, created seconds
+SNAPSHOT_RECORD = struct.Struct("<qIIIiHiqBIq")
+
+def save_snapshot(reservations, filename: str):
+    """ write reservations to a fixed-width binary snapshot with a string table """
+
+    strings = {}  # text -> index in string table
+
+    def string_id(text):
+        return strings.setdefault(text, len(strings))
+
+    records = bytearray()
+    count = 0
     for r in reservations:
+        created = r.created
+        records += SNAPSHOT_RECORD.pack(
+            r.id,
+            string_id(r.name),
+            string_id(r.email),
+            string_id(r.phone),
+            r.date.toordinal(),
+            r.time.hour * 60 + r.time.minute,
+            r.duration,
+            round(r.price * 100),
+            r.confirmed,
+            string_id(r.resource),
+            created.toordinal() * 86400 + created.hour * 3600 + created.minute * 60 + created.second,
+        )
+        count += 1
+
+    blobs = [text.encode("utf-8") for text in strings]
+    offsets = array("Q", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    with open(filename, "wb") as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, count, len(blobs)))
+        f.write(records)
+        offsets.tofile(f)
+        f.write(b"".join(blobs))
+
+class ReservationSnapshot:
+    """ memory-mapped snapshot, records are decoded into Reservation only when accessed """
+
+    def __init__(self, filename: str):
+        with open(filename, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, strings = SNAPSHOT_HEADER.unpack_from(self.map, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self.map.close()
+            raise ValueError(f"{filename} is not a reservation snapshot")
+        self.records_at = SNAPSHOT_HEADER.size
+        offsets_at = self.records_at + self.count * SNAPSHOT_RECORD.size
+        self.offsets = memoryview(self.map)[offsets_at:offsets_at + (strings + 1) * 8].cast("Q")
+        self.strings_at = offsets_at + (strings + 1) * 8
+        self.cache = {}  # decoded strings
+
+    def string(self, i):
+        """ decode string i of the string table """
+        text = self.cache.get(i)
+        if text is None:
+            start = self.strings_at + self.offsets[i]
+            end = self.strings_at + self.offsets[i + 1]
+            text = self.cache[i] = sys.intern(self.map[start:end].decode("utf-8"))
+        return text
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.count:
+            raise IndexError("snapshot index out of range")
+        return self.build(SNAPSHOT_RECORD.unpack_from(self.map, self.records_at + i * SNAPSHOT_RECORD.size))
+
+    def __iter__(self):
+        # unpack_from holds no buffer between records, so close() works mid-iteration
+        size = SNAPSHOT_RECORD.size
+        for at in range(self.records_at, self.records_at + self.count * size, size):
+            yield self.build(SNAPSHOT_RECORD.unpack_from(self.map, at))
+
+    def build(self, fields):
+        """ turn one unpacked record into a Reservation """
+        (reservation_id, name, email, phone, day, minute, duration,
+         cents, confirmed, resource, created) = fields
+        created_day, seconds = divmod(created, 86400)
+        return Reservation(
+            reservation_id=reservation_id,
+            name=self.string(name),
+            email=self.string(email),
+            phone=self.string(phone),
+            date=date.fromordinal(day),
+            time=time(minute // 60, minute % 60),
+            duration=duration,
+            price=cents / 100,
+            confirmed=bool(confirmed),
+            resource=self.string(resource),
+            created=datetime.combine(
+                date.fromordinal(created_day),
+                time(seconds // 3600, seconds // 60 % 60, seconds % 60),
+            ),
+        )
+
+    def close(self):
+        """ release the memory map """
+        self.offsets.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def load_snapshot(filename: str) -> ReservationSnapshot:
+    """ open a snapshot written by save_snapshot """
+    return ReservationSnapshot(filename)
+
+
+def merge_busy(bookings: list[Reservation]) -> tuple[array, array]:
+    """ merge bookings sorted by start and end into non-overlapping busy periods """
+
+    starts = array("q")
+    ends = array("q")
+    for r in bookings:
+        start, end = r.start_minute(), r.end_minute()
+        if ends and start <= ends[-1]:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+class BookingIndex:
+    """ per-resource interval index of reservations sorted by start and end time
+
+    Bookings of zero hours occupy no time, so they are left out: they never
+    conflict and never block a free slot.
+    """
+
+    def __init__(self, reservations):
+        by_resource = {}
+        for r in reservations:
+            if r.duration > 0:
+                by_resource.setdefault(r.resource, []).append(r)
+
+        self.bookings = {}   # resource -> reservations sorted by start and end
+        self.starts = {}     # resource -> start minutes, same order
+        self.max_ends = {}   # resource -> running maximum of end minutes
+        self.busy = {}       # resource -> (starts, ends) of merged busy periods
+        for resource, bookings in by_resource.items():
+            bookings.sort(key=lambda r: (r.start_minute(), r.end_minute()))
+            max_ends = array("q")
+            latest = 0
+            for r in bookings:
+                latest = max(latest, r.end_minute())
+                max_ends.append(latest)
+            self.bookings[resource] = bookings
+            self.starts[resource] = array("q", [r.start_minute() for r in bookings])
+            self.max_ends[resource] = max_ends
+            self.busy[resource] = merge_busy(bookings)
+
+    def conflicts(self) -> list[tuple[Reservation, Reservation]]:
+        """ return every pair of overlapping reservations of the same resource """
+
+        pairs = []
+        for bookings in self.bookings.values():
+            active = []  # heap of (end minute, position) still running
+            for i, r in enumerate(bookings):
+                start = r.start_minute()
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, j in active:
+                    pairs.append((bookings[j], r))
+                heapq.heappush(active, (r.end_minute(), i))
+        return pairs
+
+    def is_free(self, resource: str, day: date, start: time, hours: int) -> bool:
+        """ return true if resource has no booking overlapping the given slot """
+
+        starts = self.starts.get(resource)
+        if not starts:
+            return True
+        begin = to_minutes(day, start)
+        # bookings starting before the slot ends, the latest of their ends decides
+        i = bisect_left(starts, begin + hours * 60)
+        return i == 0 or self.max_ends[resource][i - 1] <= begin
+
+    def gaps(self, resource: str, begin: int, end: int, length: int):
+        """ yield (start, end) minutes of free periods of at least length minutes in [begin, end) """
+
+        busy_starts, busy_ends = self.busy.get(resource, (array("q"), array("q")))
+        candidate = begin
+        i = bisect_right(busy_ends, begin)  # first busy period still running at begin
+        while i < len(busy_starts) and candidate + length <= end:
+            gap_end = min(busy_starts[i], end)
+            if gap_end - candidate >= length:
+                yield candidate, gap_end
+            candidate = max(candidate, busy_ends[i])
+            i += 1
+        if candidate + length <= end:
+            yield candidate, end
+
+    def slot_starts(self, resource: str, begin: int, end: int, length: int, step: int):
+        """ yield start minutes of free slots of length minutes, every step minutes within each free period """
+
+        for gap_start, gap_end in self.gaps(resource, begin, end, length):
+            yield from range(gap_start, gap_end - length + 1, step)
+
+    def free_slots(self, resources: list[str], hours: int, after: datetime, until: datetime, count: int = 1, step: int = 60) -> list[tuple[datetime, str]]:
+        """ return the earliest count free slots of given hours over the resources
+
+        Candidate starts are step minutes apart from the start of each free
+        period, so slots of one resource may overlap each other.
+        """
+
+        begin = to_minutes(after.date(), after.time())
+        if after.second or after.microsecond:
+            begin += 1  # round up, a slot never starts before after
+        end = to_minutes(until.date(), until.time())  # rounded down, slots end by until
+        streams = [
+            zip(self.slot_starts(resource, begin, end, hours * 60, step), repeat(resource))
+            for resource in resources
+        ]
+        slots = []
+        for minute, resource in heapq.merge(*streams):
+            slots.append((from_minutes(minute), resource))
+            if len(slots) == count:
+                break
+        return slots
+
+
+def iter_reservations(filename: str):
+    """ read reservations from file one at a time """
+
+    def read():
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield convert_reservation(line.split("|"))
+
+    return iterate("parse", "reservations", read())
+
+
+
+def lookup_reservations(filename: str) -> ReservationLookup:
+    """ read reservations from file into hash indexes by id, email and phone """
+
+    return ReservationLookup(iter_reservations(filename), attrgetter("id", "email", "phone"))
+
+
+
+class ConfirmedReport:
+    """ collect lines of confirmed reservations """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, r: Reservation):
         if r.is_confirmed():
-            print(f"- {r.name}, {r.resource}, {r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}")
+            self.lines.append(f"- {r.name}, {r.resource}, {r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}")
 
-def long_reservations(reservations: list[Reservation]):
-    """ Print reservations that is longer than 3 hours or more """
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
 
-    for r in reservations:
+class LongReport:
+    """ collect lines of reservations that are 3 hours or longer """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, r: Reservation):
         if r.is_long():
-            print(f"- {r.name}, {r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}, duration {r.duration} h, {r.resource}")
+            self.lines.append(f"- {r.name}, {r.date.strftime('%d.%m.%Y')} at {r.time.strftime('%H.%M')}, duration {r.duration} h, {r.resource}")
 
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
 
-def confirmation_statuses(reservations: list[Reservation]):
-    """ Print if each reservation is confirmed or not """
+class StatusReport:
+    """ collect confirmed or not status of each reservation """
 
-    for r in reservations:
-        print(f"{r.name} → {'Confirmed' if r.is_confirmed() else 'NOT Confirmed'}")
+    def __init__(self):
+        self.lines = []
 
+    def add(self, r: Reservation):
+        self.lines.append(f"{r.name} → {'Confirmed' if r.is_confirmed() else 'NOT Confirmed'}")
 
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
 
-def confirmation_summary(reservations: list[Reservation]):
-    """ Print summary of confirmed and not confirmed reservations """
+class SummaryReport:
+    """ count confirmed and not confirmed reservations """
 
+    def __init__(self):
+        self.confirmed = 0
+        self.total = 0
 
-    confirmed_count = sum(1 for r in reservations if r.is_confirmed())
-    print(f"- Confirmed reservations: {confirmed_count} pcs")
-    print(f"- Not confirmed reservations: {len(reservations) - confirmed_count} pcs")
+    def add(self, r: Reservation):
+        self.total += 1
+        if r.is_confirmed():
+            self.confirmed += 1
 
+    @phase("render")
+    def print(self):
+        print(f"- Confirmed reservations: {self.confirmed} pcs")
+        print(f"- Not confirmed reservations: {self.total - self.confirmed} pcs")
 
+class RevenueReport:
+    """ sum revenue of confirmed reservations """
 
-def total_revenue(reservations: list[Reservation]):
-    """ Print total revenue from confirmed reservations """
+    def __init__(self):
+        self.revenue = 0
 
+    def add(self, r: Reservation):
+        if r.is_confirmed():
+            self.revenue += r.total_price()
 
-    revenue = sum(r.total_price() for r in reservations if r.is_confirmed())
-    print(f"Total revenue from confirmed reservations: {revenue:.2f} €".replace(".", ","))
+    @phase("render")
+    def print(self):
+        print(f"Total revenue from confirmed reservations: {self.revenue:.2f} €".replace(".", ","))
 
+@phase("aggregate")
+def run_reports(reservations, reports: list) -> list:
+    """ feed every reservation to all reports in one pass """
 
+    for r in reservations:
+        for report in reports:
+            report.add(r)
+    return reports
 
-def main():
-    """ read reservations and print all report """
 
-    reservations = fetch_reservations("reservations.txt")
 
-    print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
+def confirmed_reservations(reservations: list[Reservation]):
+    """ Print all confirmed reservations """
+
+    run_reports(reservations, [ConfirmedReport()])[0].print()
 
-    print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
+def long_reservations(reservations: list[Reservation]):
+    """ Print reservations that is longer than 3 hours or more """
 
-    print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
+    run_reports(reservations, [LongReport()])[0].print()
 
-    print("4) Confirmation Summary")
-    confirmation_summary(reservations)
+def confirmation_statuses(reservations: list[Reservation]):
+    """ Print if each reservation is confirmed or not """
+
+    run_reports(reservations, [StatusReport()])[0].print()
+
+def confirmation_summary(reservations: list[Reservation]):
+    """ Print summary of confirmed and not confirmed reservations """
+
+    run_reports(reservations, [SummaryReport()])[0].print()
+
+def total_revenue(reservations: list[Reservation]):
+    """ Print total revenue from confirmed reservations """
+
+    run_reports(reservations, [RevenueReport()])[0].print()
+
+
+
+def main():
+    """ read reservations once and print all reports """
+
+    reports = run_reports(
+        iter_reservations("reservations.txt"),
+        [ConfirmedReport(), LongReport(), StatusReport(), SummaryReport(), RevenueReport()],
+    )
+    titles = [
+        "1) Confirmed Reservations",
+        "2) Long Reservations (≥ 3 h)",
+        "3) Reservation Confirmation Status",
+        "4) Confirmation Summary",
+        "5) Total Revenue from Confirmed Reservations",
+    ]
 
-    print("5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    for title, report in zip(titles, reports):
+        print(title)
+        report.print()
 
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -23,8 +23,17 @@ int | str | str | str | date | time | int | float | bool | str | datetime
 
 
 
-from datetime import datetime
+import os
+import sys
+from operator import itemgetter
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from profiling import iterate, phase  # noqa: E402  (shared module in the repository root)
+from reservation_lookup import ReservationLookup  # noqa: E402
+from reservation_parsing import parse_created, parse_date, parse_time  # noqa: E402
+
+
+@phase("convert")
 def convert_reservation(data: list[str]) -> dict:
     """
     Convert one reservation (list of strings) to a dictionary.
@@ -34,15 +43,16 @@ def convert_reservation(data: list[str]) -> dict:
         "name": data[1],                                             # guest name (str)
         "email": data[2],                                            # guest email (str)
         "phone": data[3],                                            # guest phone (str)
-        "date": datetime.strptime(data[4], "%Y-%m-%d").date(),        # reservation date
-        "time": datetime.strptime(data[5], "%H:%M").time(),          # reservation time
+        "date": parse_date(data[4]),                                 # reservation date
+        "time": parse_time(data[5]),                                 # reservation time
         "duration": int(data[6]),                                    # duration in hours (int)
         "price": float(data[7]),                                     # price per hour (float)
         "confirmed": data[8].strip() == "True",                      # confirmed or not (boolean)
-        "resource": data[9],                                         # reserved resource/room (str)
-        "created": datetime.strptime(data[10].strip(), "%Y-%m-%d %H:%M:%S"), # created timestamp (datetimem)
+        "resource": sys.intern(data[9]),                             # reserved resource/room (str)
+        "created": parse_created(data[10].strip()),                  # created timestamp (datetimem)
     }
 
+@phase("parse")
 def fetch_reservations(filename: str) -> list[dict]:
 
     """ read reservations from a file and return list of dictionaries """
@@ -57,67 +67,160 @@ def fetch_reservations(filename: str) -> list[dict]:
 
 
 
-def confirmed_reservations(reservations: list[dict]):
-    """ Print all confirmed reservations """
-    for r in reservations:
+def iter_reservations(filename: str):
+    """ read reservations from a file one at a time """
+
+    def read():
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield convert_reservation(line.split("|"))
+
+    return iterate("parse", "reservations", read())
+
+
+
+def lookup_reservations(filename: str) -> ReservationLookup:
+    """ read reservations from file into hash indexes by id, email and phone """
+
+    return ReservationLookup(iter_reservations(filename), itemgetter("id", "email", "phone"))
+
+
+
+class ConfirmedReport:
+    """ collect lines of confirmed reservations """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, r: dict):
         if r["confirmed"]:
-            print(f"- {r['name']}, {r['resource']}, {r['date'].strftime('%d.%m.%Y')} at {r['time'].strftime('%H.%M')}")
+            self.lines.append(f"- {r['name']}, {r['resource']}, {r['date'].strftime('%d.%m.%Y')} at {r['time'].strftime('%H.%M')}")
 
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
 
+class LongReport:
+    """ collect lines of reservations that are 3 hours or longer """
 
-def long_reservations(reservations: list[dict]):
-    """ Print reservations that is longer than 3 hours or more """
-    for r in reservations:
+    def __init__(self):
+        self.lines = []
+
+    def add(self, r: dict):
         if r["duration"] >= 3:
-            print(f"- {r['name']}, {r['date'].strftime('%d.%m.%Y')} at {r['time'].strftime('%H.%M')}, duration {r['duration']} h, {r['resource']}")
+            self.lines.append(f"- {r['name']}, {r['date'].strftime('%d.%m.%Y')} at {r['time'].strftime('%H.%M')}, duration {r['duration']} h, {r['resource']}")
 
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
 
+class StatusReport:
+    """ collect confirmed or not status of each reservation """
+
+    def __init__(self):
+        self.lines = []
+
+    def add(self, r: dict):
+        self.lines.append(f"{r['name']} → {'Confirmed' if r['confirmed'] else 'NOT Confirmed'}")
+
+    @phase("render")
+    def print(self):
+        for line in self.lines:
+            print(line)
+
+class SummaryReport:
+    """ count confirmed and not confirmed reservations """
+
+    def __init__(self):
+        self.confirmed = 0
+        self.total = 0
+
+    def add(self, r: dict):
+        self.total += 1
+        if r["confirmed"]:
+            self.confirmed += 1
+
+    @phase("render")
+    def print(self):
+        print(f"- Confirmed reservations: {self.confirmed} pcs")
+        print(f"- Not confirmed reservations: {self.total - self.confirmed} pcs")
+
+class RevenueReport:
+    """ sum revenue of confirmed reservations """
+
+    def __init__(self):
+        self.revenue = 0
+
+    def add(self, r: dict):
+        if r["confirmed"]:
+            self.revenue += r["duration"] * r["price"]
+
+    @phase("render")
+    def print(self):
+        print(f"Total revenue from confirmed reservations: {self.revenue:.2f} €".replace(".", ","))
+
+@phase("aggregate")
+def run_reports(reservations, reports: list) -> list:
+    """ feed every reservation to all reports in one pass """
 
-def confirmation_statuses(reservations: list[dict]):
-    """ Print if each reservation is confirmed or not """
     for r in reservations:
-        print(f"{r['name']} → {'Confirmed' if r['confirmed'] else 'NOT Confirmed'}")
+        for report in reports:
+            report.add(r)
+    return reports
 
 
 
-def confirmation_summary(reservations: list[dict]):
-    """ Print how many reservations are confirmed and not confirmed """
+def confirmed_reservations(reservations: list[dict]):
+    """ Print all confirmed reservations """
 
-    confirmed_count = sum(1 for r in reservations if r["confirmed"])
-    print(f"- Confirmed reservations: {confirmed_count} pcs")
-    print(f"- Not confirmed reservations: {len(reservations) - confirmed_count} pcs")
+    run_reports(reservations, [ConfirmedReport()])[0].print()
 
+def long_reservations(reservations: list[dict]):
+    """ Print reservations that is longer than 3 hours or more """
 
+    run_reports(reservations, [LongReport()])[0].print()
 
-def total_revenue(reservations: list[dict]):
-    """ Print total revenue of confirmed reservations """
+def confirmation_statuses(reservations: list[dict]):
+    """ Print if each reservation is confirmed or not """
 
-    revenue = sum(r["duration"] * r["price"] for r in reservations if r["confirmed"])
-    print(f"Total revenue from confirmed reservations: {revenue:.2f} €".replace(".", ","))
+    run_reports(reservations, [StatusReport()])[0].print()
 
+def confirmation_summary(reservations: list[dict]):
+    """ Print how many reservations are confirmed and not confirmed """
 
+    run_reports(reservations, [SummaryReport()])[0].print()
 
-def main():
+def total_revenue(reservations: list[dict]):
+    """ Print total revenue of confirmed reservations """
+
+    run_reports(reservations, [RevenueReport()])[0].print()
 
-    """ read reservations and print all reports """
-    reservations = fetch_reservations("reservations.txt")
 
-    print("1) Confirmed Reservations")
-    confirmed_reservations(reservations)
 
-    print("2) Long Reservations (≥ 3 h)")
-    long_reservations(reservations)
+def main():
 
-    print("3) Reservation Confirmation Status")
-    confirmation_statuses(reservations)
+    """ read reservations once and print all reports """
 
-    print("4) Confirmation Summary")
-    confirmation_summary(reservations)
+    reports = run_reports(
+        iter_reservations("reservations.txt"),
+        [ConfirmedReport(), LongReport(), StatusReport(), SummaryReport(), RevenueReport()],
+    )
+    titles = [
+        "1) Confirmed Reservations",
+        "2) Long Reservations (≥ 3 h)",
+        "3) Reservation Confirmation Status",
+        "4) Confirmation Summary",
+        "5) Total Revenue from Confirmed Reservations",
+    ]
 
-    print("5) Total Revenue from Confirmed Reservations")
-    total_revenue(reservations)
+    for title, report in zip(titles, reports):
+        print(title)
+        report.print()
 
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
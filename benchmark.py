@@ -0,0 +1,299 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Benchmarks for the reservation and meter data pipelines.
+
+Synthetic input files are generated into a temporary directory:
+
+- reservations in the TaskC/TaskG pipe format (--rows, 10^3 ... 10^7)
+- hourly per-phase meter CSVs in the TaskD/TaskE format and
+  net meter CSVs in the TaskF format (--years, --meters)
+
+Each benchmark is timed as the best of --repeat runs. With --save the
+results are stored as the baseline; otherwise they are compared with
+the stored baseline and the script exits with status 1 when any
+benchmark is slower than baseline * --tolerance.
+
+Usage:
+  python benchmark.py --save
+  python benchmark.py --rows 100000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+for task in ("TaskC", "TaskD", "TaskE", "TaskF", "TaskG"):
+    sys.path.insert(0, os.path.join(ROOT, task))
+
+import resample  # noqa: E402
+import task_c  # noqa: E402
+import task_d  # noqa: E402
+import task_e  # noqa: E402
+import task_f  # noqa: E402
+import task_g_class  # noqa: E402
+import task_g_dict  # noqa: E402
+
+BASELINE_FILE = os.path.join(ROOT, "benchmark_baseline.json")
+
+NAMES = ["Moomin Valley", "Snork Maiden", "Little My Storm", "Sniff Moneywise", "Snufkin Wanderer"]
+RESOURCES = ["Forest Area 1", "Flower Room", "Red Room", "Storage Area N", "Meeting Room A"]
+
+
+def generate_reservations(filename: str, rows: int, seed: int = 1) -> None:
+    """Writes rows synthetic reservations in the pipe-delimited format."""
+
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+
+    with open(filename, "w", encoding="utf-8") as file:
+
+        for i in range(rows):
+
+            name = rng.choice(NAMES)
+            day = start + timedelta(days=rng.randrange(730))
+            created = datetime(2024, 6, 1) + timedelta(seconds=rng.randrange(50_000_000))
+
+            file.write(
+                f"{1000 + i}|{name}|{name.split()[0].lower()}{i}@example.com|"
+                f"040{rng.randrange(10**7):07d}|{day.isoformat()}|"
+                f"{rng.randrange(8, 20):02d}:{rng.choice(['00', '15', '30', '45'])}|"
+                f"{rng.randrange(1, 6)}|{rng.randrange(500, 5000) / 100:.2f}|"
+                f"{rng.random() < 0.6}|{rng.choice(RESOURCES)}|"
+                f"{created.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            )
+
+
+def generate_phase_csv(filename: str, years: int, seed: int = 1) -> None:
+    """Writes an hourly per-phase meter CSV (TaskD/TaskE format)."""
+
+    rng = random.Random(seed)
+    moment = datetime(2025, 1, 1)
+
+    with open(filename, "w", encoding="utf-8") as file:
+
+        file.write(
+            "Time;Consumption phase 1 Wh;Consumption phase 2 Wh;Consumption phase 3 Wh;"
+            "Production phase 1 Wh;Production phase 2 Wh;Production phase 3 Wh\n"
+        )
+
+        for _ in range(years * 365 * 24):
+            values = ";".join(str(rng.randrange(0, 1500)) for _ in range(6))
+            file.write(f"{moment.strftime('%Y-%m-%dT%H:%M:%S')};{values}\n")
+            moment += timedelta(hours=1)
+
+
+def generate_net_csv(filename: str, years: int, seed: int = 1) -> None:
+    """Writes an hourly net meter CSV with decimal commas (TaskF format)."""
+
+    rng = random.Random(seed)
+    moment = datetime(2025, 1, 1)
+
+    with open(filename, "w", encoding="utf-8") as file:
+
+        file.write("Time; Consumption (net) kWh; Production (net) kWh; Daily average temperature\n")
+
+        temperature = 0.0
+
+        for _ in range(years * 365 * 24):
+
+            if moment.hour == 0:
+                temperature = rng.randrange(-250, 250) / 10
+
+            values = [
+                f"{rng.randrange(0, 3000) / 1000:.3f}",
+                f"{rng.randrange(0, 2000) / 1000:.3f}",
+                f"{temperature:.1f}",
+            ]
+            file.write(
+                f"{moment.strftime('%Y-%m-%dT%H:%M:%S')}.000+02:00;"
+                + ";".join(value.replace(".", ",") for value in values) + "\n"
+            )
+            moment += timedelta(hours=1)
+
+
+def best_time(func, repeat: int) -> float:
+    """Returns the best wall time of repeat calls, output suppressed."""
+
+    best = float("inf")
+
+    for _ in range(repeat):
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def peak_memory(func) -> int:
+    """Returns the peak traced memory in bytes while func runs."""
+
+    tracemalloc.start()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def reservation_benchmarks(filename: str) -> dict:
+    """Returns reservation pipeline benchmarks by name."""
+
+    benchmarks = {}
+
+    for name, module in (("task_c", task_c), ("task_g_class", task_g_class), ("task_g_dict", task_g_dict)):
+
+        loaded = module.fetch_reservations(filename)
+
+        benchmarks[f"{name}.fetch_reservations"] = lambda m=module: m.fetch_reservations(filename)
+
+        for report in ("confirmed_reservations", "long_reservations", "confirmation_statuses",
+                       "confirmation_summary", "total_revenue"):
+            benchmarks[f"{name}.{report}"] = lambda f=getattr(module, report), r=loaded: f(r)
+
+    return benchmarks
+
+
+def meter_benchmarks(phase_files: list[str], net_files: list[str]) -> dict:
+    """Returns meter pipeline benchmarks by name."""
+
+    benchmarks = {}
+
+    phase_data = task_e.read_data(phase_files[0])
+    first_day = phase_data[0][0].date()
+    week = [first_day + timedelta(days=i) for i in range(7)]
+
+    benchmarks["task_d.read_data"] = lambda: [task_d.read_data(f) for f in phase_files]
+    benchmarks["task_d.calculate_daily"] = lambda: task_d.calculate_daily(phase_data)
+    benchmarks["task_e.read_data"] = lambda: [task_e.read_data(f) for f in phase_files]
+    benchmarks["task_e.calculate_day"] = lambda: [task_e.calculate_day(phase_data, d) for d in week]
+    benchmarks["resample.resample_rows"] = lambda: resample.resample_rows(
+        phase_data, ["15min", "hour", "day", "week", "month", "year"]
+    )
+
+    rows = task_f.read_data(net_files[0])
+    columns = task_f.read_columns(net_files[0])
+    daily = task_f.calculate_daily(rows)
+    index = task_f.build_index(daily)
+
+    benchmarks["task_f.read_data"] = lambda: [task_f.read_data(f) for f in net_files]
+    benchmarks["task_f.calculate_daily"] = lambda: task_f.calculate_daily(rows)
+    benchmarks["task_f.read_columns"] = lambda: [task_f.read_columns(f) for f in net_files]
+    benchmarks["task_f.calculate_daily_columns"] = lambda: task_f.calculate_daily_columns(columns)
+    benchmarks["task_f.build_index"] = lambda: task_f.build_index(daily)
+    benchmarks["task_f.monthly_report"] = lambda: task_f.monthly_report(index, 6)
+    benchmarks["task_f.yearly_report"] = lambda: task_f.create_yearly_report(index)
+    benchmarks["resample.resample_columns"] = lambda: resample.resample_columns(
+        columns, ["hour", "day", "week", "month", "year"]
+    )
+
+    return benchmarks
+
+
+def compare_representations(filename: str) -> None:
+    """Prints time and peak memory of the dict and class TaskG variants."""
+
+    print("\nTaskG representations (fetch_reservations + all reports)")
+
+    for name, module in (("dict", task_g_dict), ("class", task_g_class)):
+
+        def run(m=module):
+            reservations = m.fetch_reservations(filename)
+            for report in (m.confirmed_reservations, m.long_reservations, m.confirmation_statuses,
+                           m.confirmation_summary, m.total_revenue):
+                report(reservations)
+
+        seconds = best_time(run, 1)
+        memory = peak_memory(lambda m=module: m.fetch_reservations(filename))
+
+        print(f"  {name:<6} {seconds:9.4f} s   peak {memory / 1e6:8.1f} MB")
+
+
+def main() -> None:
+    """Generates data, runs benchmarks and compares with the baseline."""
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="reservations to generate (10^3 ... 10^7)")
+    parser.add_argument("--years", type=int, default=2, help="years of hourly meter data")
+    parser.add_argument("--meters", type=int, default=2, help="meter files per format")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is kept")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="allowed slowdown factor")
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+
+        reservations = os.path.join(workdir, "reservations.txt")
+        generate_reservations(reservations, args.rows)
+
+        phase_files = []
+        net_files = []
+
+        for meter in range(args.meters):
+
+            phase_files.append(os.path.join(workdir, f"phases{meter}.csv"))
+            generate_phase_csv(phase_files[-1], args.years, seed=meter)
+
+            net_files.append(os.path.join(workdir, f"net{meter}.csv"))
+            generate_net_csv(net_files[-1], args.years, seed=meter)
+
+        benchmarks = reservation_benchmarks(reservations)
+        benchmarks.update(meter_benchmarks(phase_files, net_files))
+
+        results = {name: best_time(func, args.repeat) for name, func in benchmarks.items()}
+
+        compare_representations(reservations)
+
+    key = f"rows={args.rows},years={args.years},meters={args.meters}"
+
+    baselines = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, "r", encoding="utf-8") as file:
+            baselines = json.load(file)
+
+    baseline = baselines.get(key, {})
+    regressions = []
+
+    print(f"\n{'benchmark':<40} {'seconds':>10} {'baseline':>10} {'ratio':>7}")
+
+    for name, seconds in results.items():
+
+        base = baseline.get(name)
+        ratio = seconds / base if base else None
+
+        if ratio is not None and ratio > args.tolerance:
+            regressions.append(name)
+
+        print(f"{name:<40} {seconds:10.4f} "
+              f"{base if base is not None else float('nan'):10.4f} "
+              f"{ratio if ratio is not None else float('nan'):7.2f}"
+              f"{'  SLOWER' if name in regressions else ''}")
+
+    if args.save:
+        baselines[key] = results
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {BASELINE_FILE}")
+
+    elif regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline x {args.tolerance}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
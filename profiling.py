@@ -0,0 +1,152 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Shared timers and counters for the report scripts.
+
+Profiling is on when the script is started with --profile or the
+PROFILE environment variable is set to a non-empty value other than 0.
+When it is off, phase() returns the function unchanged and timer()
+returns a shared no-op context, so instrumented code runs as before.
+
+When on, a JSON breakdown is written to stderr at exit:
+
+{"phases": {"parse": {"calls": 1, "seconds": 0.01}, ...},
+ "functions": {"parse:read_data": {"calls": 1, "seconds": 0.01}, ...},
+ "counters": {"rows": 8760}}
+
+Times are inclusive, so a phase that calls another one counts its time too.
+Work done in child processes (e.g. a process pool) is not included.
+"""
+
+import atexit
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+ENABLED = "--profile" in sys.argv[1:] or os.environ.get("PROFILE", "") not in ("", "0")
+
+_phases = {}     # phase -> [calls, seconds]
+_functions = {}  # phase:function -> [calls, seconds]
+_counters = {}   # name -> value
+_NO_TIMER = nullcontext()
+
+
+def _record(phase_name: str, key: str, seconds: float) -> None:
+    """Adds one timed call to the phase and function totals."""
+
+    for table, name in ((_phases, phase_name), (_functions, key)):
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def phase(phase_name: str):
+    """Decorator that times every call of a function under a phase."""
+
+    def decorate(func):
+
+        if not ENABLED:
+            return func
+
+        key = f"{phase_name}:{func.__qualname__}"
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(phase_name, key, time.perf_counter() - start)
+
+        return timed
+
+    return decorate
+
+
+@contextmanager
+def _timed_block(phase_name: str, key: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(phase_name, key, time.perf_counter() - start)
+
+
+def timer(phase_name: str, name: str = "block"):
+    """Context manager that times a block of code under a phase."""
+
+    if not ENABLED:
+        return _NO_TIMER
+
+    return _timed_block(phase_name, f"{phase_name}:{name}")
+
+
+def iterate(phase_name: str, name: str, iterable):
+    """Times the items of an iterable under a phase and counts them.
+
+    The time spent producing every item is added up and recorded as one
+    call when the iterable is exhausted, and the items are added to the
+    counter of the same name. Time the consumer spends between items is
+    not included.
+    """
+
+    if not ENABLED:
+        return iterable
+
+    return _timed_items(phase_name, name, iter(iterable))
+
+
+def _timed_items(phase_name: str, name: str, items):
+    seconds = 0.0
+    n = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            finally:
+                seconds += time.perf_counter() - start
+            n += 1
+            yield item
+    finally:
+        _record(phase_name, f"{phase_name}:{name}", seconds)
+        count(name, n)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Adds value to a named counter."""
+
+    if ENABLED:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def breakdown() -> dict:
+    """Returns the collected timings and counters."""
+
+    def table(entries):
+        return {
+            name: {"calls": calls, "seconds": round(seconds, 6)}
+            for name, (calls, seconds) in entries.items()
+        }
+
+    return {
+        "phases": table(_phases),
+        "functions": table(_functions),
+        "counters": dict(_counters),
+    }
+
+
+def _report() -> None:
+    print(json.dumps(breakdown()), file=sys.stderr)
+
+
+if ENABLED:
+    atexit.register(_report)
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Resampling of meter series into calendar or fixed-width intervals.
+
+Works on the rows returned by read_data() in TaskD and TaskE
+([time, value, value, ...]), on the rows and column arrays of TaskF
+(read_data() and read_columns()) or on a list of times and value columns.
+For each bucket it computes the count and the sum, mean, min and max
+of every column.
+
+Granularities are "15min", "hour", "day", "week" (starting Monday),
+"month" and "year", or any whole-second timedelta for fixed-width
+buckets counted from datetime.min. Times are taken to the second.
+
+Times are converted once to seconds since 0001-01-01. Every bucket is
+then a contiguous run of rows, found with one bisect per bucket, so
+adding a granularity costs per bucket, not per row. Each column is
+reduced with C-level sum(), min() and max() over its run slices. Rows
+that are not in time order are sorted first.
+
+Example:
+
+    rows = read_data("week42.csv")
+    result = resample_rows(rows, ["hour", "day", timedelta(hours=6)])
+    for start, total in zip(result["day"]["start"], result["day"]["sum"][0]):
+        print(start, total)
+"""
+
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+
+DAY = 86400
+
+# Fixed widths in seconds. datetime.min is a Monday at midnight, so
+# hours, days and weeks are fixed-width buckets too.
+FIXED = {
+    "15min": 900,
+    "hour": 3600,
+    "day": DAY,
+    "week": 7 * DAY,
+}
+
+
+def next_month(day: date) -> date:
+    """Returns the first day of the month after day."""
+
+    return date(day.year + 1, 1, 1) if day.month == 12 else date(day.year, day.month + 1, 1)
+
+
+# Calendar granularities: (start of the bucket, start of the next one)
+CALENDAR = {
+    "month": (lambda d: d.replace(day=1), next_month),
+    "year": (lambda d: d.replace(month=1, day=1), lambda d: date(d.year + 1, 1, 1)),
+}
+
+
+def bucket_bounds(seconds: list[int], granularity) -> tuple[list[datetime], list[int]]:
+    """Splits sorted times into buckets.
+
+    Parameters:
+     seconds: sorted times as seconds since 0001-01-01
+     granularity: granularity name or timedelta
+
+    Returns:
+     (bucket starts, row positions where each bucket starts plus the row count)
+    """
+
+    n = len(seconds)
+    bounds = [0]
+    i = 0
+
+    if granularity in CALENDAR:
+
+        first_day, following_day = CALENDAR[granularity]
+        days = []
+
+        while i < n:
+            day = date.fromordinal(seconds[i] // DAY)
+            days.append(first_day(day))
+            i = bisect_left(seconds, following_day(day).toordinal() * DAY, i)
+            bounds.append(i)
+
+        return [datetime(d.year, d.month, d.day) for d in days], bounds
+
+    width = FIXED.get(granularity, granularity)
+
+    if isinstance(width, timedelta):
+        if width.microseconds:
+            raise ValueError(f"Width must be whole seconds: {granularity!r}")
+        width = width.days * DAY + width.seconds
+
+    if not isinstance(width, int) or width <= 0:
+        raise ValueError(f"Unknown granularity: {granularity!r}")
+
+    # datetime.min is second DAY of this scale, buckets are counted from it
+    starts = []
+
+    while i < n:
+        start = seconds[i] - (seconds[i] - DAY) % width
+        starts.append(start)
+        i = bisect_left(seconds, start + width, i)
+        bounds.append(i)
+
+    return [datetime.min + timedelta(seconds=start - DAY) for start in starts], bounds
+
+
+def reduce_column(column, bounds: list[int]) -> tuple[list, list, list]:
+    """Returns per-bucket sums, minimums and maximums of one column."""
+
+    if len(bounds) == len(column) + 1:  # one row per bucket
+        values = list(column)
+        return values, values, values
+
+    parts = [column[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    return list(map(sum, parts)), list(map(min, parts)), list(map(max, parts))
+
+
+def resample_seconds(seconds: list[int], columns: list, granularities: list) -> dict:
+    """Buckets a series given as seconds since 0001-01-01.
+
+    Parameters:
+     seconds: time of each row
+     columns: value sequences, each as long as seconds
+     granularities: granularities to produce
+
+    Returns:
+     {granularity: {"start", "count", "sum", "mean", "min", "max"}}
+     where start and count hold one value per bucket and sum, mean, min
+     and max hold one such list per column
+    """
+
+    if any(a > b for a, b in zip(seconds, seconds[1:])):
+        order = sorted(range(len(seconds)), key=seconds.__getitem__)
+        seconds = [seconds[i] for i in order]
+        columns = [[column[i] for i in order] for column in columns]
+
+    result = {}
+
+    for granularity in granularities:
+
+        starts, bounds = bucket_bounds(seconds, granularity)
+        counts = [b - a for a, b in zip(bounds, bounds[1:])]
+        reduced = [reduce_column(column, bounds) for column in columns]
+
+        result[granularity] = {
+            "start": starts,
+            "count": counts,
+            "sum": [sums for sums, _, _ in reduced],
+            "mean": [[total / n for total, n in zip(sums, counts)] for sums, _, _ in reduced],
+            "min": [mins for _, mins, _ in reduced],
+            "max": [maxs for _, _, maxs in reduced],
+        }
+
+    return result
+
+
+def resample(times: list[datetime], columns: list, granularities: list) -> dict:
+    """Buckets the series into every granularity, see resample_seconds()."""
+
+    seconds = [t.toordinal() * DAY + t.hour * 3600 + t.minute * 60 + t.second for t in times]
+
+    return resample_seconds(seconds, columns, granularities)
+
+
+def resample_rows(rows: list[list], granularities: list) -> dict:
+    """Resamples rows of [time, value, ...] as returned by read_data() in TaskD/TaskE.
+
+    All rows must have the same number of values.
+    """
+
+    if not rows:
+        return resample_seconds([], [], granularities)
+
+    width = len(rows[0])
+
+    for i, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"Row {i} has {len(row)} fields, expected {width}")
+
+    times, *columns = zip(*rows)
+
+    return resample(times, columns, granularities)
+
+
+def resample_columns(columns: dict, granularities: list) -> dict:
+    """Resamples the column arrays returned by read_columns() in TaskF.
+
+    The columns are consumption, production and temperature.
+    """
+
+    seconds = [day * DAY + hour * 3600 for day, hour in zip(columns["days"], columns["hours"])]
+    values = [columns["consumption"], columns["production"], columns["temperature"]]
+
+    return resample_seconds(seconds, values, granularities)
+
+
+def resample_csv_rows(rows: list[list[str]], granularities: list) -> dict:
+    """Resamples the raw rows returned by read_data() in TaskF.
+
+    The first row is the header. Values use decimal commas and the
+    timestamp offset is ignored, as in TaskF.
+    """
+
+    times = [datetime.fromisoformat(row[0][:19]) for row in rows[1:]]
+    columns = [
+        [float(row[c].replace(",", ".")) for row in rows[1:]]
+        for c in range(1, len(rows[0]))
+    ]
+
+    return resample(times, columns, granularities)
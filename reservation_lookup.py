@@ -0,0 +1,70 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Hash indexes for point lookups of reservations by id, email and phone.
+
+Works with the reservation lists of TaskC, the Reservation objects of
+TaskG/task_g_class.py and the dictionaries of TaskG/task_g_dict.py: the
+keys function picks (id, email, phone) out of one reservation. Emails
+are matched case-insensitively.
+
+The lookup works as the collection of ReservationTail too, so appended
+reservations are indexed as they arrive. The indexes are rebuilt at load
+time: reading them back from a file is no faster than building them from
+the converted rows.
+
+Example:
+
+    lookup = ReservationLookup(reservations, attrgetter("id", "email", "phone"))
+    lookup.find_email("My@TinyRage.net")
+"""
+
+from operator import itemgetter
+
+LIST_KEYS = itemgetter(0, 2, 3)  # reservations converted to lists in TaskC
+
+
+class ReservationLookup:
+    """Indexes from reservation id, email and phone to row positions."""
+
+    def __init__(self, reservations=None, keys=LIST_KEYS):
+        self.keys = keys
+        self.reservations = []
+        self.by_id = {}     # id -> position
+        self.by_email = {}  # lowercase email -> positions
+        self.by_phone = {}  # phone -> positions
+        for reservation in reservations or []:
+            self.append(reservation)
+
+    def append(self, reservation) -> None:
+        """Adds one converted reservation and indexes it."""
+
+        reservation_id, email, phone = self.keys(reservation)
+        position = len(self.reservations)
+        self.reservations.append(reservation)
+        self.by_id[reservation_id] = position
+        self.by_email.setdefault(email.lower(), []).append(position)
+        self.by_phone.setdefault(phone, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.reservations)
+
+    def __iter__(self):
+        return iter(self.reservations)
+
+    def find_id(self, reservation_id: int):
+        """Returns the reservation with the id, None if not found."""
+
+        position = self.by_id.get(reservation_id)
+        return None if position is None else self.reservations[position]
+
+    def find_email(self, email: str) -> list:
+        """Returns the reservations made with the email."""
+
+        return [self.reservations[i] for i in self.by_email.get(email.lower(), [])]
+
+    def find_phone(self, phone: str) -> list:
+        """Returns the reservations made with the phone number."""
+
+        return [self.reservations[i] for i in self.by_phone.get(phone, [])]
@@ -0,0 +1,47 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Date and time parsers for the reservation fields of TaskC and TaskG.
+
+The fixed formats YYYY-MM-DD, HH:MM and YYYY-MM-DD HH:MM:SS are parsed
+with fromisoformat(); anything else goes through strptime() so that the
+same values are accepted and the same errors raised as before. Dates and
+start times repeat heavily (a few hundred distinct values per year), so
+their parsers are cached. createdAt values are nearly all distinct and
+are not cached.
+
+Example:
+
+    day = parse_date("2024-06-14")
+    start = parse_time("09:00")
+"""
+
+from datetime import date, datetime, time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> date:
+    """Converts YYYY-MM-DD to a date."""
+
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        return date.fromisoformat(text)
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=1024)
+def parse_time(text: str) -> time:
+    """Converts HH:MM to a time."""
+
+    if len(text) == 5 and text[2] == ":":
+        return time.fromisoformat(text)
+    return datetime.strptime(text, "%H:%M").time()
+
+
+def parse_created(text: str) -> datetime:
+    """Converts YYYY-MM-DD HH:MM:SS to a datetime."""
+
+    if len(text) == 19 and text[10] == " ":
+        return datetime.fromisoformat(text)
+    return datetime.strptime(text, "%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,99 @@
+# Copyright (c) 2026 Gökhan Arifoglu
+# License: MIT
+
+"""
+Incremental loader for the append-only reservation files of TaskC and TaskG.
+
+The tail remembers the byte offset it has consumed, so refresh() reads and
+converts only lines appended since the previous call. Each converted row is
+added to the collection and fed to the report accumulators in place.
+
+Newline-terminated lines are always consumed. An unterminated last line is
+consumed only when it is a whole record: 11 fields ending in a fixed-width
+YYYY-MM-DD HH:MM:SS createdAt, as at the end of the shipped reservation
+files. Anything shorter is a write still in progress (append_lines() in
+TaskC ends every write with a newline) and is left for the next refresh.
+A complete line that does not convert is reported on stderr and skipped,
+so it is never retried and rows before it are never added twice.
+
+Example:
+
+    tail = ReservationTail("reservations.txt", convert_reservation, lookup, reports)
+    tail.refresh()
+"""
+
+import re
+import sys
+
+CREATED = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+
+def is_whole_record(raw: bytes) -> bool:
+    """
+    Tells whether an unterminated line holds a whole record
+
+    A record cut off mid-write has fewer than 11 fields or a createdAt
+    shorter than 19 characters.
+    """
+    fields = raw.split(b"|")
+    return len(fields) == 11 and CREATED.fullmatch(fields[10]) is not None
+
+
+class ReservationTail:
+    """
+    Incremental loader for an append-only reservation file
+
+    Parameters:
+     filename (str): Name of the file containing the reservations
+     convert (callable): Converts the split fields of one line
+     reservations: Collection with append(), a list by default
+     reports (list): Report accumulators with add()
+    """
+
+    def __init__(self, filename: str, convert, reservations=None, reports: list | None = None):
+        self.filename = filename
+        self.convert = convert
+        self.offset = 0   # bytes already consumed
+        self.skipped = 0  # complete lines that did not convert
+        self.reservations = reservations if reservations is not None else []
+        self.reports = reports if reports is not None else []
+
+    def refresh(self) -> int:
+        """
+        Converts the whole lines appended since the last refresh
+
+        Returns:
+         count (int): Number of new reservations
+        """
+        with open(self.filename, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+
+        count = 0
+        position = 0
+        while True:
+            end = data.find(b"\n", position)
+            if end == -1:
+                if position == len(data) or not is_whole_record(data[position:]):
+                    break  # partial write, wait for the newline
+                end = len(data)
+            start = self.offset
+            raw = data[position:end]
+            position = end + 1
+            self.offset += len(raw) + (end < len(data))
+
+            try:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                reservation = self.convert(line.split("|"))
+            except (ValueError, IndexError) as e:
+                self.skipped += 1
+                print(f"{self.filename}: skipped line at byte {start}: {e}", file=sys.stderr)
+                continue
+
+            self.reservations.append(reservation)
+            for report in self.reports:
+                report.add(reservation)
+            count += 1
+        return count